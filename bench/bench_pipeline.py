@@ -0,0 +1,73 @@
+"""End-to-end benchmark of the scrape-to-render pipeline against the fake DocUX API.
+
+Times authentication, fetch, normalization, sorting and table row building
+for several record counts, offline:
+
+    python bench/bench_pipeline.py
+    python bench/bench_pipeline.py --sizes 1000 10000 --repeat 5 --json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_docux_server import FakeDocuxServer  # noqa: E402
+
+PHASES = ("auth", "fetch", "parse", "sort", "rows_first_page", "rows_all")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run_once(server: FakeDocuxServer) -> dict:
+    from modules.core.state import LoginState
+    from modules.data.records import normalize_records
+    from modules.scrape.scrape_manager import ScrapeManager
+    from modules.ui.table_view import DocumentTable
+
+    state = LoginState()
+    state.credentials.update({"email": "bench@example.com", "password": "bench"})
+    manager = ScrapeManager(state, server.scrape_config())
+
+    timings = {}
+    auth_data, timings["auth"] = timed(manager.authenticate)
+    payload, timings["fetch"] = timed(lambda: manager.fetch_management_data(
+        auth_data["Token"], 1, 2025, auth_data["EntidadesContacto"][0]["EntidadId"]
+    ))
+    records, timings["parse"] = timed(lambda: normalize_records(payload))
+    _, timings["sort"] = timed(lambda: records.sort(key=lambda r: r.sort_key()))
+    _, timings["rows_first_page"] = timed(lambda: DocumentTable().set_records(records))
+    _, timings["rows_all"] = timed(lambda: DocumentTable(virtualized=False).set_records(records))
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    parser.add_argument("--json", action="store_true", help="print one JSON line per size")
+    args = parser.parse_args(argv)
+
+    if not args.json:
+        print(f"{'records':>8} " + " ".join(f"{p:>16}" for p in PHASES) + "   (median ms)")
+    for size in args.sizes:
+        with FakeDocuxServer(records=size, latency=args.latency) as server:
+            runs = [run_once(server) for _ in range(args.repeat)]
+        medians = {p: statistics.median(r[p] for r in runs) * 1000 for p in PHASES}
+        if args.json:
+            print(json.dumps({"records": size, "repeat": args.repeat, "median_ms": medians}))
+        else:
+            print(f"{size:>8} " + " ".join(f"{medians[p]:>16.2f}" for p in PHASES))
+
+
+if __name__ == "__main__":
+    main()
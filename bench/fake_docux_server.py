@@ -0,0 +1,210 @@
+"""Local stand-in for the DocUX API.
+
+Implements getSecretKey, authenticate and getGestionDocsRequeridas with
+generated data, configurable record counts, latency and error rate. Point a
+ScrapeConfig at it with FakeDocuxServer.scrape_config().
+
+    python bench/fake_docux_server.py --records 10000 --latency 0.05
+"""
+import argparse
+import base64
+import gzip
+import json
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SECRET_KEY = "fake-secret-key"
+
+ESTADOS = ("Vencido", "Pendiente", "Pendiente aprobación", "Aprobado", "Aprobado", "Aprobado")
+ENTES = ("AUTOMOVIL", "CHASIS", "ACOPLADO", "PERSONA", "EMPRESA")
+DOCUMENTOS = ("Seguro", "VTV", "Cédula verde", "ART", "Libreta sanitaria", "Habilitación", "F.931")
+SERVICIOS = ("Transporte de cargas", "Limpieza", "Seguridad", "Mantenimiento", "Catering")
+
+
+def make_token(ttl: float) -> str:
+    """Unsigned JWT-shaped token carrying an exp claim."""
+    def part(obj):
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+    return f"{part({'alg': 'none'})}.{part({'exp': int(time.time() + ttl)})}.sig"
+
+
+def token_expiry(token: str) -> float:
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))["exp"]
+
+
+def generate_records(count: int, entity, month: int, year: int) -> list:
+    """Deterministic records for one entity and period."""
+    rng = random.Random(f"{entity}-{month}-{year}")
+    today = date.today()
+    records = []
+    for i in range(count):
+        ente = rng.choice(ENTES)
+        estado = rng.choice(ESTADOS)
+        vencimiento = today + timedelta(days=rng.randint(-30, 365))
+        records.append({
+            "DenominacionEnte": ente,
+            "VehiculoPatente": f"{chr(65 + i % 26)}{chr(65 + i // 26 % 26)}{i % 1000:03d}XY" if ente in ENTES[:3] else None,
+            "DocumentacionDenominacion": rng.choice(DOCUMENTOS),
+            "ServicioDenominacion": rng.choice(SERVICIOS),
+            "Archivo": {
+                "Id": i,
+                "EstadoDenominacion": estado,
+                "FechaVencimiento": vencimiento.isoformat() + "T00:00:00-03:00" if estado == "Aprobado" else None,
+            },
+        })
+    return records
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"  # type: ignore
+
+    def log_message(self, format, *args):
+        if self.server.options["verbose"]:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body):
+        data = json.dumps(body).encode()
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            data = gzip.compress(data, compresslevel=5)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _simulate(self) -> bool:
+        """Apply latency and random failures; returns False when a 500 was sent."""
+        options = self.server.options
+        if options["latency"]:
+            time.sleep(options["latency"])
+        if options["error_rate"] and random.random() < options["error_rate"]:
+            self._send(500, {"Message": "Simulated failure"})
+            return False
+        return True
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if not self._simulate():
+            return
+        if self.path.split("?")[0].endswith("/getSecretKey"):
+            self._send(200, {"Valor": SECRET_KEY})
+        else:
+            self._send(404, {"Message": "Not found"})
+
+    def do_POST(self):
+        if not self._simulate():
+            return
+        options = self.server.options
+        path = self.path.split("?")[0]
+        body = self._body()
+        if path.endswith("/authenticate"):
+            if body.get("secretKey") != SECRET_KEY or not body.get("Denominacion") or not body.get("Clave"):
+                self._send(401, {"Message": "Credenciales inválidas"})
+                return
+            self._send(200, {
+                "Token": make_token(options["token_ttl"]),
+                "EntidadesContacto": [{"EntidadId": 100 + i} for i in range(options["entities"])],
+            })
+        elif path.endswith("/getGestionDocsRequeridas"):
+            auth = self.headers.get("Authorization", "")
+            try:
+                valid = token_expiry(auth.removeprefix("Bearer ")) > time.time()
+            except Exception:
+                valid = False
+            if not valid:
+                self._send(401, {"Message": "Token inválido"})
+                return
+            periodo = body.get("Periodo", {})
+            self._send(200, generate_records(
+                options["records"], periodo.get("EntidadId"), periodo.get("Mes"), periodo.get("Año")
+            ))
+        else:
+            self._send(404, {"Message": "Not found"})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    options: dict
+
+
+class FakeDocuxServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, records: int = 100, entities: int = 1,
+                 latency: float = 0.0, error_rate: float = 0.0, token_ttl: float = 3600, verbose: bool = False):
+        self.httpd = _Server((host, port), _Handler)
+        self.httpd.options = {
+            "records": records,
+            "entities": entities,
+            "latency": latency,
+            "error_rate": error_rate,
+            "token_ttl": token_ttl,
+            "verbose": verbose,
+        }
+        self._thread = None
+
+    @property
+    def options(self) -> dict:
+        return self.httpd.options
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def scrape_config(self, **kwargs):
+        from modules.scrape.scrape_manager import ScrapeConfig
+        return ScrapeConfig(
+            secret_key_url=f"{self.base_url}/DocUXApi/api/RegistroEntidad/getSecretKey?param=459",
+            auth_url=f"{self.base_url}/CommonApi/api/Usuarios/authenticate",
+            management_url=f"{self.base_url}/DocUXApi/api/DocumentacionesRequeridas/getGestionDocsRequeridas",
+            **kwargs,
+        )
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--records", type=int, default=100, help="records per entity and period")
+    parser.add_argument("--entities", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--token-ttl", type=float, default=3600)
+    args = parser.parse_args(argv)
+    server = FakeDocuxServer(args.host, args.port, args.records, args.entities, args.latency,
+                             args.error_rate, args.token_ttl, verbose=True)
+    print(f"Fake DocUX API on {server.base_url}", file=sys.stderr)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
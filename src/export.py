@@ -0,0 +1,121 @@
+"""Headless export of DocUX management data, without starting Flet.
+
+    python src/export.py --email user@example.com --from 2025-01 --to 2025-12 \\
+        --format csv --output docs.csv
+
+The password is read from DOCUX_PASSWORD or prompted for. Records are streamed
+from the API straight into the output file, so memory use stays constant.
+"""
+import argparse
+import getpass
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from modules.core.state import LoginState
+from modules.data.export import WRITERS, open_writer
+from modules.scrape.scrape_manager import ScrapeManager, entity_ids, iter_periods
+
+_DONE = object()
+
+
+def parse_period(value: str) -> date:
+    """YYYY-MM -> first day of that month."""
+    try:
+        year, month = value.split("-")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"período inválido {value!r}, use AAAA-MM")
+
+
+def export(manager: ScrapeManager, writer, start: date, end: date, entities=None, jobs: int = 4,
+           incl_approved_doc: bool = True) -> int:
+    """Stream every (entity, period) into `writer`. Up to `jobs` downloads run at once
+    and feed a bounded queue that this thread drains into the file."""
+    auth_data = manager.authenticate()
+    token = auth_data.get("Token")
+    work = [(entity, m, y) for entity in entity_ids(auth_data, entities) for m, y in iter_periods(start, end)]
+    records = queue.Queue(maxsize=1000)
+    stopped = threading.Event()
+
+    def offer(item):
+        # Blocks while the writer is behind, gives up once it has stopped.
+        while not stopped.is_set():
+            try:
+                records.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+
+    def download(entity, month, year):
+        if stopped.is_set():
+            return
+        try:
+            for raw in manager.iter_management_data(token, month, year, entity, incl_approved_doc):  # type: ignore
+                if stopped.is_set():
+                    return
+                raw.update(EntidadId=entity, PeriodoMes=month, PeriodoAnio=year)
+                offer(raw)
+        except Exception as e:
+            offer(e)
+        finally:
+            offer(_DONE)
+
+    written = 0
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for item in work:
+            pool.submit(download, *item)
+        remaining = len(work)
+        try:
+            while remaining:
+                item = records.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    writer.write(item)
+                    written += 1
+        finally:
+            # On error, queued downloads must not start a request each before exiting.
+            stopped.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+    return written
+
+
+def main(argv=None):
+    today = date.today().replace(day=1)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", default=os.environ.get("DOCUX_EMAIL"), help="usuario (o DOCUX_EMAIL)")
+    parser.add_argument("--from", dest="start", type=parse_period, default=today, help="primer período AAAA-MM")
+    parser.add_argument("--to", dest="end", type=parse_period, default=None, help="último período AAAA-MM")
+    parser.add_argument("--entity", dest="entities", type=int, action="append",
+                        help="EntidadId a exportar (repetible); por defecto todas")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--output", "-o", required=True)
+    parser.add_argument("--jobs", type=int, default=4, help="descargas simultáneas")
+    parser.add_argument("--only-pending", action="store_true", help="excluir documentación aprobada")
+    args = parser.parse_args(argv)
+
+    if not args.email:
+        parser.error("se requiere --email o DOCUX_EMAIL")
+    state = LoginState()
+    state.credentials["email"] = args.email
+    state.credentials["password"] = os.environ.get("DOCUX_PASSWORD") or getpass.getpass("Contraseña: ")
+
+    writer = open_writer(args.format, args.output)
+    started = time.perf_counter()
+    try:
+        count = export(ScrapeManager(state), writer, args.start, args.end or args.start, args.entities,
+                       args.jobs, incl_approved_doc=not args.only_pending)
+    finally:
+        writer.close()
+    print(f"{count} registros exportados a {args.output} en {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
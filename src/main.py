@@ -1,10 +1,19 @@
+import time
+
+STARTED = time.perf_counter()
+
 import flet as ft
-from modules.ui.main_flow import MainFlow
+
 
 async def main(page: ft.Page):
-    flow = MainFlow(page)
-    # print(page)
+    # Deferred so the window opens before the app modules are loaded.
+    import_start = time.perf_counter()
+    from modules.ui.main_flow import MainFlow
+    from modules.core.timing import record, start_run
+    start_run("startup")
+    flow = MainFlow(page, started=STARTED)
+    record("startup.imports", (time.perf_counter() - import_start) * 1000)
     await flow.run()
 
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    ft.app(target=main)
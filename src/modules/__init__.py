@@ -1 +1,10 @@
-from .ui_helpers import show_error, loading_indicator
\ No newline at end of file
+# UI helpers import Flet; load them lazily so headless tools can use the
+# scrape/data modules without it.
+__all__ = ["show_error", "loading_indicator"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import ui_helpers
+        return getattr(ui_helpers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
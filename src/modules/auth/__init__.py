@@ -1,4 +1,5 @@
 from .auth_manager import AuthManager
 from .session_manager import SessionManager
+from .account_store import AccountStore
 
-__all__ = ["AuthManager", "SessionManager"]
\ No newline at end of file
+__all__ = ["AuthManager", "SessionManager", "AccountStore"]
\ No newline at end of file
@@ -0,0 +1,61 @@
+import os
+import threading
+
+from modules.core.state import LoginState
+from modules.core.timing import span
+from .session_manager import restore_state, session_from_state
+
+
+class AccountStore:
+    """Encrypted store of several account sessions (token, entity ids, expiry;
+    never passwords). The file is decrypted once and kept in a dict by email."""
+
+    def __init__(self, path: str = "accounts.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._accounts = self._load()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with span("accounts.load"):
+            from modules.auth.encryption import decrypt_credentials
+            with open(self.path, "r") as f:
+                return decrypt_credentials(f.read())
+
+    def _save(self):
+        with span("accounts.save", accounts=len(self._accounts)):
+            from modules.auth.encryption import encrypt_credentials
+            encrypted = encrypt_credentials(self._accounts)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(encrypted)
+            os.replace(tmp, self.path)
+
+    def emails(self) -> list:
+        return sorted(self._accounts)
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __contains__(self, email):
+        return email in self._accounts
+
+    def save_state(self, state: LoginState):
+        """Add or update the account of `state`. Safe to use as ScrapeManager.on_token."""
+        with self._lock:
+            self._accounts[state.credentials.get("email")] = session_from_state(state)
+            self._save()
+
+    def remove(self, email: str):
+        with self._lock:
+            if self._accounts.pop(email, None) is not None:
+                self._save()
+
+    def state_for(self, email: str):
+        """LoginState with the stored token of `email`, or None if missing or expired."""
+        session = self._accounts.get(email)
+        state = LoginState()
+        if session is None or not restore_state(session, state):
+            return None
+        return state
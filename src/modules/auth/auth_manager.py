@@ -1,11 +1,16 @@
 from ..core.state import LoginState
 from ..core.exceptions import AuthError
+from ..core.timing import span
 
 class AuthManager:
     def __init__(self, state: LoginState):
         self.state = state
 
     async def validate_credentials(self, credentials: dict):
+        with span("auth.validate_credentials"):
+            self._validate(credentials)
+
+    def _validate(self, credentials: dict):
         # Validación más flexible
         if not credentials.get("email") or not credentials.get("password"):
             raise AuthError("Todos los campos son requeridos")
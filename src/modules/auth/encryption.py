@@ -4,7 +4,16 @@ from cryptography.fernet import Fernet
 
 KEY_FILE = "session_key.key"
 
+_fernet = None
+
 def get_fernet():
+    # The key file is read once per process.
+    global _fernet
+    if _fernet is None:
+        _fernet = _load_fernet()
+    return _fernet
+
+def _load_fernet():
     if os.path.exists(KEY_FILE):
         with open(KEY_FILE, "rb") as f:
             key = f.read()
@@ -24,3 +33,9 @@ def decrypt_credentials(encrypted_data: str) -> dict:
     fernet = get_fernet()
     decrypted = fernet.decrypt(encrypted_data.encode())
     return json.loads(decrypted.decode())
+
+def encrypt_bytes(data: bytes) -> bytes:
+    return get_fernet().encrypt(data)
+
+def decrypt_bytes(token: bytes) -> bytes:
+    return get_fernet().decrypt(token)
@@ -1,5 +1,8 @@
 import json
 import os
+import time
+
+from modules.core.timing import span
 
 class SessionManager:
     def __init__(self, page):
@@ -8,17 +11,59 @@ class SessionManager:
 
     async def load_session(self):
         if os.path.exists(self.session_file):
-            with open(self.session_file, "r") as f:
-                encrypted = f.read()
-            # Decrypt the stored session.
-            from modules.auth.encryption import decrypt_credentials  # adjust import as needed
-            session = decrypt_credentials(encrypted)
+            with span("session.load"):
+                with open(self.session_file, "r") as f:
+                    encrypted = f.read()
+                # Decrypt the stored session.
+                from modules.auth.encryption import decrypt_credentials  # adjust import as needed
+                session = decrypt_credentials(encrypted)
             return session
         return None
 
     def save_session(self, session):
         # Encrypt the session before saving.
-        from modules.auth.encryption import encrypt_credentials  # adjust import as needed
-        encrypted = encrypt_credentials(session)
-        with open(self.session_file, "w") as f:
-            f.write(encrypted)
+        with span("session.save"):
+            from modules.auth.encryption import encrypt_credentials  # adjust import as needed
+            encrypted = encrypt_credentials(session)
+            with open(self.session_file, "w") as f:
+                f.write(encrypted)
+
+    def clear_session(self):
+        if os.path.exists(self.session_file):
+            os.remove(self.session_file)
+
+    def save_state(self, state):
+        """Persist the token, entity ids and expiry of a LoginState (no password)."""
+        self.save_session(session_from_state(state))
+
+    def restore_state(self, session, state, margin: float = 60) -> bool:
+        """Load a saved token into `state`. Returns False if there is none or it is about to expire."""
+        return restore_state(session, state, margin)
+
+
+def session_from_state(state) -> dict:
+    return {
+        "email": state.credentials.get("email"),
+        "token": state.token,
+        "entity_ids": state.entity_ids,
+        "issued_at": state.token_issued_at,
+        "expires_at": state.token_expires_at,
+        "token_lifetime": state.token_lifetime,
+    }
+
+
+def restore_state(session, state, margin: float = 60) -> bool:
+    if not session.get("token"):
+        return False
+    expires_at = session.get("expires_at")
+    if expires_at is not None and time.time() + margin >= expires_at:
+        return False
+    state.credentials["email"] = session.get("email")
+    state.token_lifetime = session.get("token_lifetime")
+    state.set_token(
+        session["token"],
+        session.get("entity_ids"),
+        expires_at=expires_at,
+        issued_at=session.get("issued_at"),
+    )
+    return True
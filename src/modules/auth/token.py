@@ -0,0 +1,23 @@
+import base64
+import json
+import time
+
+
+def decode_token_expiry(token: str):
+    """Return the `exp` claim of a JWT as a unix timestamp, or None if the token
+    is not a JWT or carries no expiry. The signature is not verified."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def token_expiry(token: str, issued_at: float = None, lifetime: float = None): # type: ignore
+    """Expiry of `token`: the decoded `exp` claim, else issued_at + a lifetime learned from 401s."""
+    expiry = decode_token_expiry(token)
+    if expiry is None and lifetime:
+        expiry = (issued_at or time.time()) + lifetime
+    return expiry
@@ -1,4 +1,7 @@
 from .state import LoginState
 from .exceptions import *
 
-__all__ = ["LoginState", "SessionError", "AuthError", "DataError"]
\ No newline at end of file
+__all__ = [
+    "LoginState", "SessionError", "AuthError", "DataError",
+    "TransportError", "RequestTimeoutError", "ServiceUnavailableError", "CircuitOpenError",
+]
\ No newline at end of file
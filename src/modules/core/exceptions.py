@@ -9,4 +9,16 @@ class DataError(AppException):
     """Data loading errors"""
     
 class SessionError(AppException):
-    """Session management errors"""
\ No newline at end of file
+    """Session management errors"""
+
+class TransportError(AppException):
+    """Network errors talking to the DocUX API"""
+
+class RequestTimeoutError(TransportError):
+    """The API did not answer within the configured timeout"""
+
+class ServiceUnavailableError(TransportError):
+    """The API kept failing (connection errors or 5xx) after all retries"""
+
+class CircuitOpenError(TransportError):
+    """Calls are short-circuited because the API has been failing"""
@@ -1,5 +1,5 @@
 # state.py
-import asyncio
+import time
 
 class LoginState:
     def __init__(self):
@@ -9,6 +9,26 @@ class LoginState:
             "keep_logged_in": False
         }
         self.token = None         # token obtained after authentication
-        self.entity_id = None     # entity id from authentication
-        self.event = asyncio.Event()
+        self.entity_id = None     # first entity id from authentication
+        self.entity_ids = []      # every EntidadId in EntidadesContacto
+        self.token_issued_at = None   # unix time the token was obtained
+        self.token_expires_at = None  # unix time the token stops being valid, if known
+        self.token_lifetime = None    # lifetime learned from a 401 when the token has no exp
         self.error = None
+
+    def set_token(self, token, entity_ids, expires_at=None, issued_at=None):
+        self.token = token
+        self.entity_ids = list(entity_ids or [])
+        self.entity_id = self.entity_ids[0] if self.entity_ids else None
+        self.token_issued_at = issued_at or time.time()
+        self.token_expires_at = expires_at
+
+    def clear_token(self):
+        self.token = None
+        self.token_issued_at = None
+        self.token_expires_at = None
+
+    def token_valid(self, margin: float = 0) -> bool:
+        if self.token is None:
+            return False
+        return self.token_expires_at is None or time.time() + margin < self.token_expires_at
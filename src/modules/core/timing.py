@@ -0,0 +1,60 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+logger = logging.getLogger("docux.timing")
+logger.propagate = False
+
+_lock = threading.Lock()
+_last_run = []   # spans of the current/last run, for the debug overlay
+_run = {"name": None, "started": None}
+
+
+def configure_timing(path: str = "timing.log", max_bytes: int = 1024 * 1024, backups: int = 3):
+    """Write timing records as JSON lines to a rotating log file."""
+    if any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
+        return
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+def start_run(name: str):
+    """Start a new run (e.g. one login or refresh); the overlay shows the spans of the last one."""
+    with _lock:
+        _last_run.clear()
+        _run["name"] = name
+        _run["started"] = time.time()
+
+
+def last_run() -> tuple:
+    """(run name, list of span records) of the latest run."""
+    with _lock:
+        return _run["name"], list(_last_run)
+
+
+def record(name: str, ms: float, **fields):
+    """Emit a timing record measured elsewhere (e.g. time since process start)."""
+    fields.update(span=name, ms=round(ms, 2), ts=round(time.time(), 3), run=_run["name"])
+    with _lock:
+        _last_run.append(fields)
+    if logger.handlers:
+        logger.info(json.dumps(fields, default=str))
+
+
+@contextmanager
+def span(name: str, **fields):
+    """Time a block. Extra fields (payload bytes, record counts...) can be passed
+    here or added to the yielded dict inside the block."""
+    start = time.perf_counter()
+    try:
+        yield fields
+    except BaseException as e:
+        fields["error"] = type(e).__name__
+        raise
+    finally:
+        record(name, (time.perf_counter() - start) * 1000, **fields)
@@ -1,3 +1,11 @@
-from .data_loader import DataLoader
+from .records import DocumentRecord, normalize_records
 
-__all__ = ["DataLoader"]
\ No newline at end of file
+__all__ = ["DataLoader", "DocumentRecord", "normalize_records"]
+
+
+def __getattr__(name):
+    # DataLoader imports Flet; only load it when asked for.
+    if name == "DataLoader":
+        from .data_loader import DataLoader
+        return DataLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
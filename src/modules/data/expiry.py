@@ -0,0 +1,106 @@
+import datetime
+import heapq
+import itertools
+
+
+class ExpiryEngine:
+    """Approved documents ordered by expiry date, with a precomputed alert calendar.
+
+    Records live in a min-heap keyed by their expiry date and alerts in a second
+    heap keyed by the date each threshold is crossed (expiry - threshold days).
+    Every push gets a new sequence number, stored in `entries`; heap items whose
+    sequence no longer matches belong to a replaced or removed record and are
+    dropped lazily when they reach the top, so updates cost O(log n) per changed
+    record and queries O(k log n) for k results.
+    """
+
+    def __init__(self, thresholds=(30, 15, 7, 1), on_alert=None):
+        self.thresholds = sorted(set(thresholds), reverse=True)
+        self.on_alert = on_alert  # callback(list of (record, threshold))
+        self.entries = {}         # key -> (seq, expires, record) currently tracked
+        self._heap = []           # (expires, seq, key)
+        self._alerts = []         # (alert date, seq, threshold, key, expires)
+        self._fired = set()       # (key, expires, threshold) already notified
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _tracked(record) -> bool:
+        return record.estado == "Aprobado" and record.expires is not None
+
+    def _push(self, record, today: datetime.date):
+        expires = record.expires
+        seq = next(self._seq)
+        self.entries[record.key] = (seq, expires, record)
+        heapq.heappush(self._heap, (expires, seq, record.key))
+        days_left = (expires - today).days
+        # Future crossings, plus the tightest threshold already crossed (only once).
+        crossed = [t for t in self.thresholds if t >= days_left]
+        for threshold in self.thresholds:
+            if threshold < days_left or (crossed and threshold == crossed[-1]):
+                alert_date = expires - datetime.timedelta(days=threshold)
+                heapq.heappush(self._alerts, (alert_date, seq, threshold, record.key, expires))
+
+    def upsert(self, records, today: datetime.date = None): # type: ignore
+        """Add or update records (e.g. a streamed batch); others are left as they are."""
+        today = today or datetime.date.today()
+        for record in records:
+            current = self.entries.get(record.key)
+            if not self._tracked(record):
+                if current is not None:
+                    del self.entries[record.key]
+            elif current is None or current[1] != record.expires:
+                self._push(record, today)
+            else:
+                self.entries[record.key] = (current[0], current[1], record)
+
+    def update(self, records, today: datetime.date = None): # type: ignore
+        """Apply a complete scrape result: records missing from it stop being tracked."""
+        records = list(records)
+        seen = {r.key for r in records}
+        for key in [k for k in self.entries if k not in seen]:
+            del self.entries[key]
+        self.upsert(records, today)
+
+    def _valid(self, key, seq) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and entry[0] == seq
+
+    def _clean_top(self):
+        while self._heap and not self._valid(self._heap[0][2], self._heap[0][1]):
+            heapq.heappop(self._heap)
+
+    def _take_while(self, keep_going) -> list:
+        """Pop valid entries in expiry order while keep_going(expires, taken) holds,
+        then push them back."""
+        taken = []
+        self._clean_top()
+        while self._heap and keep_going(self._heap[0][0], len(taken)):
+            taken.append(heapq.heappop(self._heap))
+            self._clean_top()
+        for item in taken:
+            heapq.heappush(self._heap, item)
+        return [self.entries[key][2] for _expires, _seq, key in taken]
+
+    def next_to_expire(self, n: int = 10) -> list:
+        return self._take_while(lambda _expires, count: count < n)
+
+    def expiring_within(self, days: int, today: datetime.date = None) -> list: # type: ignore
+        limit = (today or datetime.date.today()) + datetime.timedelta(days=days)
+        return self._take_while(lambda expires, _count: expires <= limit)
+
+    def due_alerts(self, today: datetime.date = None) -> list: # type: ignore
+        """Pop the alerts whose date has come and notify on_alert with them."""
+        today = today or datetime.date.today()
+        due = []
+        while self._alerts and self._alerts[0][0] <= today:
+            _date, seq, threshold, key, expires = heapq.heappop(self._alerts)
+            if expires < today or not self._valid(key, seq) or (key, expires, threshold) in self._fired:
+                continue
+            self._fired.add((key, expires, threshold))
+            due.append((self.entries[key][2], threshold))
+        if due and self.on_alert is not None:
+            self.on_alert(due)
+        return due
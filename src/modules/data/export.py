@@ -0,0 +1,95 @@
+import csv
+import json
+
+from .records import DocumentRecord
+
+# Flat columns written to CSV and Parquet.
+COLUMNS = (
+    "EntidadId", "PeriodoMes", "PeriodoAnio", "Estado", "DiasRestantes", "FechaVencimiento",
+    "Denominacion", "Patente", "Documento", "Servicio",
+)
+
+
+def flat_row(raw: dict) -> dict:
+    record = DocumentRecord(raw)
+    return {
+        "EntidadId": record.entity_id,
+        "PeriodoMes": record.month,
+        "PeriodoAnio": record.year,
+        "Estado": record.estado,
+        "DiasRestantes": record.days_left,
+        "FechaVencimiento": record.expires.isoformat() if record.expires else None,
+        "Denominacion": record.denominacion,
+        "Patente": record.patente,
+        "Documento": record.documento,
+        "Servicio": record.servicio,
+    }
+
+
+class CsvWriter:
+    def __init__(self, path: str):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, raw: dict):
+        self.writer.writerow(flat_row(raw))
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlWriter:
+    """One raw API record per line, with every field the API returned."""
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, raw: dict):
+        self.file.write(json.dumps(raw, ensure_ascii=False))
+        self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """Buffers `row_group_size` rows and writes them as one Parquet row group."""
+
+    def __init__(self, path: str, row_group_size: int = 10_000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("La exportación a Parquet requiere pyarrow (pip install pyarrow)")
+        self.pa = pa
+        self.schema = pa.schema([
+            ("EntidadId", pa.int64()), ("PeriodoMes", pa.int32()), ("PeriodoAnio", pa.int32()),
+            ("Estado", pa.string()), ("DiasRestantes", pa.int32()), ("FechaVencimiento", pa.string()),
+            ("Denominacion", pa.string()), ("Patente", pa.string()), ("Documento", pa.string()),
+            ("Servicio", pa.string()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.row_group_size = row_group_size
+        self.rows = []
+
+    def write(self, raw: dict):
+        self.rows.append(flat_row(raw))
+        if len(self.rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def open_writer(fmt: str, path: str):
+    return WRITERS[fmt](path)
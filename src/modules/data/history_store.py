@@ -0,0 +1,133 @@
+import datetime
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    entity_id     INTEGER NOT NULL,
+    year          INTEGER NOT NULL,
+    month         INTEGER NOT NULL,
+    doc_key       TEXT    NOT NULL,
+    estado        TEXT,
+    denominacion  TEXT,
+    patente       TEXT,
+    documento     TEXT,
+    servicio      TEXT,
+    vencimiento   TEXT,
+    fetched_at    REAL,
+    PRIMARY KEY (entity_id, year, month, doc_key)
+);
+CREATE INDEX IF NOT EXISTS ix_documents_estado ON documents (estado, year, month);
+CREATE INDEX IF NOT EXISTS ix_documents_vencimiento ON documents (vencimiento);
+CREATE INDEX IF NOT EXISTS ix_documents_patente ON documents (patente);
+CREATE INDEX IF NOT EXISTS ix_documents_servicio ON documents (servicio);
+"""
+
+_UPSERT = """
+INSERT INTO documents (entity_id, year, month, doc_key, estado, denominacion, patente, documento, servicio, vencimiento, fetched_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (entity_id, year, month, doc_key) DO UPDATE SET
+    estado = excluded.estado,
+    denominacion = excluded.denominacion,
+    patente = excluded.patente,
+    documento = excluded.documento,
+    servicio = excluded.servicio,
+    vencimiento = excluded.vencimiento,
+    fetched_at = excluded.fetched_at
+"""
+
+# Rows of the most recent stored period of each entity.
+_LATEST = """
+SELECT d.* FROM documents d
+JOIN (SELECT entity_id, MAX(year * 100 + month) AS period FROM documents GROUP BY entity_id) l
+  ON d.entity_id = l.entity_id AND d.year * 100 + d.month = l.period
+"""
+
+
+class HistoryStore:
+    """Local SQLite store of every fetched management record, one row per
+    (entity, period, document), for trend and expiry queries without the API."""
+
+    def __init__(self, path: str = "history.db"):
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def upsert(self, records) -> int:
+        """Store a complete fetch of DocumentRecords: each (entity, period) in it is
+        replaced, so documents the API no longer returns are deleted. Records
+        without entity or period are skipped."""
+        now = time.time()
+        rows = [
+            (
+                r.entity_id, r.year, r.month, json.dumps(r.key[3:], ensure_ascii=False, default=str),
+                r.estado, r.denominacion, r.patente, r.documento, r.servicio,
+                r.expires.isoformat() if r.expires else None, now,
+            )
+            for r in records
+            if r.entity_id is not None and r.year is not None and r.month is not None
+        ]
+        periods = {}
+        for row in rows:
+            periods.setdefault(row[:3], set()).add(row[3])
+        with self._lock, self.conn:
+            stale = [
+                (*period, doc_key)
+                for period, doc_keys in periods.items()
+                for (doc_key,) in self.conn.execute(
+                    "SELECT doc_key FROM documents WHERE entity_id = ? AND year = ? AND month = ?", period
+                )
+                if doc_key not in doc_keys
+            ]
+            self.conn.executemany(
+                "DELETE FROM documents WHERE entity_id = ? AND year = ? AND month = ? AND doc_key = ?", stale
+            )
+            self.conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def expiring_within(self, days: int, entities=None, today: datetime.date = None) -> list: # type: ignore
+        """Approved documents of the latest period of each entity expiring in the next `days` days."""
+        today = today or datetime.date.today()
+        sql = f"SELECT * FROM ({_LATEST}) WHERE estado = 'Aprobado' AND vencimiento BETWEEN ? AND ?"
+        params = [today.isoformat(), (today + datetime.timedelta(days=days)).isoformat()]
+        if entities:
+            sql += f" AND entity_id IN ({','.join('?' * len(entities))})"
+            params.extend(entities)
+        return self._query(sql + " ORDER BY vencimiento", params)
+
+    def estado_counts(self, estado: str = None, entities=None) -> list: # type: ignore
+        """Document count per period and estado (optionally one estado), oldest first."""
+        sql = "SELECT year, month, estado, COUNT(*) AS total FROM documents WHERE 1 = 1"
+        params = []
+        if estado:
+            sql += " AND estado = ?"
+            params.append(estado)
+        if entities:
+            sql += f" AND entity_id IN ({','.join('?' * len(entities))})"
+            params.extend(entities)
+        return self._query(sql + " GROUP BY year, month, estado ORDER BY year, month, estado", params)
+
+    def find(self, estado: str = None, patente: str = None, servicio: str = None, # type: ignore
+             entity: int = None, year: int = None, month: int = None, limit: int = 1000) -> list: # type: ignore
+        """Documents matching every given field, newest period first."""
+        filters = {"estado": estado, "patente": patente, "servicio": servicio,
+                   "entity_id": entity, "year": year, "month": month}
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return self._query(
+            f"SELECT * FROM documents{where} ORDER BY year DESC, month DESC LIMIT ?", params + [limit]
+        )
@@ -0,0 +1,71 @@
+import re
+from bisect import bisect_left
+
+# DocumentRecord attributes that can be filtered on.
+INDEXED_FIELDS = ("estado", "denominacion", "patente", "documento", "servicio", "account")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class RecordIndex:
+    """In-memory inverted index over sorted DocumentRecords.
+
+    Each indexed field maps a lowercased value to the positions of its records.
+    Field values repeat a lot, so words are tokenized once per distinct value:
+    a sorted list of words is searched by prefix with bisect, and each word
+    points to the position lists of the values containing it. Filters and
+    free-text search are then set intersections instead of a scan, and the
+    index grows with the number of distinct values, not with every prefix.
+    Results keep the order of the records the index was built from.
+    """
+
+    def __init__(self, records=None):
+        self.build(records or [])
+
+    def build(self, records):
+        self.records = list(records)
+        self.fields = {field: {} for field in INDEXED_FIELDS}
+        for pos, record in enumerate(self.records):
+            for field in INDEXED_FIELDS:
+                self.fields[field].setdefault(getattr(record, field).lower(), []).append(pos)
+        words = {}
+        for values in self.fields.values():
+            for value, positions in values.items():
+                for token in set(tokenize(value)):
+                    words.setdefault(token, []).append(positions)
+        self.words = words
+        self.tokens = sorted(words)
+
+    def values(self, field: str) -> list:
+        """Distinct values of a field, in their original spelling."""
+        return sorted(
+            getattr(self.records[positions[0]], field) for value, positions in self.fields[field].items() if value
+        )
+
+    def _text_matches(self, prefix: str) -> set:
+        matches = set()
+        i = bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            for positions in self.words[self.tokens[i]]:
+                matches.update(positions)
+            i += 1
+        return matches
+
+    def query(self, text: str = "", **filters) -> list:
+        """Records matching every non-empty field filter (exact, case-insensitive)
+        and every token of `text` (as a prefix of any indexed field's words)."""
+        sets = []
+        for field, value in filters.items():
+            if value:
+                sets.append(self.fields[field].get(value.lower(), ()))
+        for token in tokenize(text or ""):
+            sets.append(self._text_matches(token))
+        if not sets:
+            return list(self.records)
+        sets.sort(key=len)
+        positions = set(sets[0]).intersection(*sets[1:])
+        return [self.records[pos] for pos in sorted(positions)]
@@ -0,0 +1,78 @@
+import datetime
+import sys
+from functools import lru_cache
+
+# Sort order of Estado values; unknown values go last.
+SORT_ORDER = {
+    "Vencido": 0,
+    "Pendiente": 1,
+    "Pendiente aprobación": 2,
+    "Aprobado": 3,
+}
+
+# DenominacionEnte values whose rows show the vehicle Patente.
+PATENTE_ENTES = ("AUTOMOVIL", "CHASIS", "ACOPLADO")
+
+
+@lru_cache(maxsize=4096)
+def parse_fecha(fecha_str):
+    """Date part of an API date ("2025-03-01" or "2025-03-01T00:00:00-03:00"), or None."""
+    if not fecha_str:
+        return None
+    try:
+        return datetime.date.fromisoformat(fecha_str.strip()[:10])
+    except ValueError:
+        return None
+
+
+def _text(value) -> str:
+    # Interned: the same denominations and services repeat across thousands of rows.
+    return sys.intern(str(value)) if value else ""
+
+
+class DocumentRecord:
+    """One row of getGestionDocsRequeridas, normalized once from the API payload."""
+
+    __slots__ = (
+        "key", "account", "entity_id", "month", "year", "estado", "estado_rank",
+        "denominacion", "patente", "documento", "servicio", "expires", "days_left",
+    )
+
+    def __init__(self, raw: dict, today: datetime.date = None): # type: ignore
+        archivo = raw.get("Archivo") or {}
+        self.account = _text(raw.get("Cuenta"))
+        self.entity_id = raw.get("EntidadId")
+        self.month = raw.get("PeriodoMes")
+        self.year = raw.get("PeriodoAnio")
+        self.estado = _text(archivo.get("EstadoDenominacion"))
+        self.estado_rank = SORT_ORDER.get(self.estado, 99)
+        self.denominacion = _text(raw.get("DenominacionEnte"))
+        vehiculo_patente = _text(raw.get("VehiculoPatente"))
+        self.patente = vehiculo_patente if self.denominacion.upper() in PATENTE_ENTES else ""
+        self.documento = _text(raw.get("DocumentacionDenominacion"))
+        self.servicio = _text(raw.get("ServicioDenominacion"))
+        self.expires = parse_fecha(archivo.get("FechaVencimiento"))
+        # Stable identity across refreshes.
+        self.key = (
+            self.entity_id, self.month, self.year, self.denominacion,
+            vehiculo_patente, self.documento, self.servicio, archivo.get("Id"), self.account,
+        )
+        self.refresh_days_left(today or datetime.date.today())
+
+    def refresh_days_left(self, today: datetime.date):
+        self.days_left = (self.expires - today).days if self.expires is not None else None
+
+    def sort_key(self) -> tuple:
+        if self.estado == "Aprobado":
+            return (self.estado_rank, self.days_left if self.days_left is not None else float("inf"))
+        return (self.estado_rank, 0)
+
+    def __repr__(self):
+        return f"DocumentRecord({self.estado!r}, {self.denominacion!r}, {self.patente!r}, {self.documento!r}, {self.servicio!r})"
+
+
+def normalize_records(payload, today: datetime.date = None) -> list: # type: ignore
+    """Convert the raw API list into DocumentRecords, parsing dates only once.
+    Records that are already DocumentRecords (e.g. from a stream) are kept as is."""
+    today = today or datetime.date.today()
+    return [raw if isinstance(raw, DocumentRecord) else DocumentRecord(raw, today) for raw in payload or []]
@@ -0,0 +1,52 @@
+import asyncio
+
+from modules.core.exceptions import AuthError
+from modules.scrape.scrape_manager import AsyncScrapeManager, ScrapeConfig
+
+
+class AccountPool:
+    """One AsyncScrapeManager per account, scraped concurrently. Records are
+    tagged with their account (field "Cuenta") so they can share one table."""
+
+    def __init__(self, store, config: ScrapeConfig = None, cache=None, max_accounts: int = 10): # type: ignore
+        self.store = store
+        self.config = config
+        self.cache = cache
+        self.semaphore = asyncio.Semaphore(max_accounts)
+        self.managers = {}
+
+    def manager_for(self, email: str) -> AsyncScrapeManager:
+        manager = self.managers.get(email)
+        if manager is None:
+            state = self.store.state_for(email)
+            if state is None:
+                raise AuthError(f"La sesión de {email} expiró, ingrese nuevamente")
+            manager = AsyncScrapeManager(state, self.config, cache=self.cache)
+            manager.sync.on_token = self.store.save_state
+            self.managers[email] = manager
+        return manager
+
+    async def _scrape_account(self, email: str, fresh: bool):
+        async with self.semaphore:
+            records = await self.manager_for(email).scrape(fresh=fresh)
+        for rec in records:
+            rec["Cuenta"] = email
+        return records
+
+    async def scrape_all(self, emails=None, fresh: bool = False) -> tuple:
+        """Scrape every stored account (or only `emails`) at once.
+        Returns (combined records, {email: error}) so one failing account does not hide the rest."""
+        emails = list(emails) if emails is not None else self.store.emails()
+        results = await asyncio.gather(
+            *(self._scrape_account(email, fresh) for email in emails), return_exceptions=True
+        )
+        combined, errors = [], {}
+        for email, result in zip(emails, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                errors[email] = result
+                self.managers.pop(email, None)
+            else:
+                combined.extend(result)
+        return combined, errors
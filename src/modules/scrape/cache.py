@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from datetime import datetime
+
+from modules.auth.encryption import encrypt_bytes, decrypt_bytes
+
+
+class ResponseCache:
+    """On-disk cache for DocUX responses.
+
+    Entries are JSON, zlib-compressed and Fernet-encrypted with the session key.
+    The current period expires after `ttl` seconds; past periods use `past_ttl`
+    (None keeps them until evicted). When the directory grows beyond `max_bytes`
+    the least recently used entries are removed.
+    """
+
+    def __init__(self, directory: str = "cache", ttl: float = 300, past_ttl: float = None, max_bytes: int = 50 * 1024 * 1024): # type: ignore
+        self.directory = directory
+        self.ttl = ttl
+        self.past_ttl = past_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def management_key(entity, month: int, year: int, incl_approved_doc: bool = True) -> tuple:
+        return ("management", entity, month, year, bool(incl_approved_doc))
+
+    def ttl_for(self, month: int, year: int):
+        now = datetime.now()
+        if (year, month) < (now.year, now.month):
+            return self.past_ttl
+        return self.ttl
+
+    def _path(self, key) -> str:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.directory, digest + ".bin")
+
+    def get(self, key, max_age: float = None, allow_stale: bool = False): # type: ignore
+        """Return the cached value, or None if missing, unreadable or older than max_age."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = json.loads(zlib.decompress(decrypt_bytes(f.read())))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt entry or rotated key: drop it.
+            self.delete(key)
+            return None
+        if not allow_stale and max_age is not None and time.time() - entry["t"] > max_age:
+            return None
+        os.utime(path)  # mark as recently used
+        return entry["d"]
+
+    def set(self, key, value):
+        blob = encrypt_bytes(zlib.compress(json.dumps({"t": time.time(), "d": value}).encode()))
+        path = self._path(key)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        self._evict()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".bin"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+            if total <= self.max_bytes:
+                return
+            for _mtime, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    @staticmethod
+    def entities_key(email) -> tuple:
+        return ("entities", email)
+
+    def current_records(self, email, entities=None):
+        """Last known records of the current month for every cached entity of `email`
+        (stale entries included), or None if any is missing. No network involved."""
+        ids = self.get(self.entities_key(email))
+        if not ids:
+            return None
+        if entities is not None:
+            wanted = set(entities)
+            ids = [eid for eid in ids if eid in wanted]
+        now = datetime.now()
+        combined = []
+        for entity in ids:
+            records = self.get(self.management_key(entity, now.month, now.year), allow_stale=True)
+            if records is None:
+                return None
+            for rec in records:
+                rec.update(EntidadId=entity, PeriodoMes=now.month, PeriodoAnio=now.year)
+            combined.extend(records)
+        return combined
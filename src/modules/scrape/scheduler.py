@@ -0,0 +1,126 @@
+import asyncio
+import inspect
+import random
+
+from modules.core.exceptions import AuthError
+
+
+class RefreshScheduler:
+    """Periodically refreshes data in the background.
+
+    `refresh` is an async callable returning the new payload and `on_result`
+    (plain or async) receives it and returns the DocumentRecords it displayed. The next interval
+    depends on those records: `min_interval` while something is urgent (Pendiente
+    aprobación, or Aprobado within `urgent_days` of expiry), `base_interval`
+    after a change, growing by `growth` up to `max_interval` while nothing
+    changes. Transport failures back off exponentially with full jitter; an
+    AuthError stops the loop, since retrying with a rejected token cannot help.
+    """
+
+    def __init__(
+        self,
+        refresh,
+        on_result,
+        min_interval: float = 60,
+        base_interval: float = 300,
+        max_interval: float = 1800,
+        growth: float = 1.5,
+        urgent_days: int = 7,
+        on_error=None,
+    ):
+        self.refresh = refresh
+        self.on_result = on_result
+        self.on_error = on_error
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.urgent_days = urgent_days
+        self.interval = base_interval
+        self.failures = 0
+        self._signature = None
+        self._running = asyncio.Event()
+        self._running.set()
+        self._wake = asyncio.Event()
+        self._task = None
+
+    def start(self, records=None, failed: bool = False):
+        """Start the loop. `records` are the ones already on screen, if any; with
+        `failed` they are stale because loading them failed, and the first retry
+        already backs off."""
+        if records is not None:
+            self.interval = self.next_interval(records)
+        if failed:
+            self.failures = 1
+            self.interval = self.backoff_interval()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def refresh_now(self):
+        self._wake.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def is_urgent(self, record) -> bool:
+        if record.estado == "Pendiente aprobación":
+            return True
+        return record.estado == "Aprobado" and record.days_left is not None and record.days_left <= self.urgent_days
+
+    def next_interval(self, records) -> float:
+        signature = hash(tuple((r.key, r.estado, r.expires) for r in records))
+        changed = signature != self._signature
+        self._signature = signature
+        if any(self.is_urgent(r) for r in records):
+            return self.min_interval
+        if changed:
+            return self.base_interval
+        return min(self.interval * self.growth, self.max_interval)
+
+    def backoff_interval(self) -> float:
+        ceiling = min(self.max_interval, self.min_interval * 2 ** self.failures)
+        return random.uniform(self.min_interval / 2, ceiling)
+
+    async def _sleep(self, seconds: float):
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self):
+        while True:
+            await self._sleep(self.interval)
+            # Hidden window: hold here until resumed, then refresh right away.
+            await self._running.wait()
+            try:
+                payload = await self.refresh()
+                records = self.on_result(payload)
+                if inspect.isawaitable(records):
+                    records = await records
+                self.failures = 0
+                self.interval = self.next_interval(records or [])
+            except asyncio.CancelledError:
+                raise
+            except AuthError as e:
+                self._task = None
+                if self.on_error is not None:
+                    self.on_error(e)
+                return
+            except Exception as e:
+                self.failures += 1
+                self.interval = self.backoff_interval()
+                if self.on_error is not None:
+                    self.on_error(e)
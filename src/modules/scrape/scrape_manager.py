@@ -1,27 +1,117 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+import asyncio
+import random
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from modules.core.state import LoginState
+from modules.core.exceptions import AuthError, DataError, TransportError
+from modules.core.timing import span
+from modules.auth.token import token_expiry
+from modules.scrape.single_flight import SingleFlight
+from modules.scrape.streaming import iter_json_array
+from modules.scrape.transport import Transport
 
 @dataclass
 class ScrapeConfig:
     secret_key_url: str = "https://docs.tpr.com.ar:2001/DocUXApi/api/RegistroEntidad/getSecretKey?param=459"
     auth_url: str = "https://docs.tpr.com.ar:2001/CommonApi/api/Usuarios/authenticate"
     management_url: str = "https://docs.tpr.com.ar:2001/DocUXApi/api/DocumentacionesRequeridas/getGestionDocsRequeridas"
+    connect_timeout: float = 5.0   # seconds to establish the TCP/TLS connection
+    read_timeout: float = 30.0     # seconds to wait for the server response
+    pool_size: int = 10            # keep-alive connections kept per host
+    max_concurrency: int = 6       # parallel period requests in scrape_range
+    max_retries: int = 2           # extra attempts for idempotent calls
+    backoff_base: float = 0.5      # seconds, doubled on every retry (with jitter)
+    backoff_max: float = 8.0
+    breaker_threshold: int = 5     # consecutive failures that open the circuit
+    breaker_reset: float = 30.0    # seconds the circuit stays open
+    hedge_after: float = None      # send a duplicate read after this many seconds; None disables # type: ignore
+
+    @property
+    def timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+
+
+# Pooled keep-alive sessions shared by every ScrapeManager, one per pool size.
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_http_session(pool_size: int = 10) -> requests.Session:
+    """Return the shared requests.Session so repeated calls reuse the same TLS connection."""
+    with _sessions_lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[pool_size] = session
+        return session
+
+def warm_up(config: "ScrapeConfig" = None, pool_size: int = 10): # type: ignore
+    """Open a pooled TLS connection to the API host ahead of the first real call."""
+    from urllib.parse import urlsplit
+    config = config or ScrapeConfig()
+    parts = urlsplit(config.auth_url)
+    try:
+        get_http_session(pool_size).head(f"{parts.scheme}://{parts.netloc}/", timeout=config.timeout)
+    except requests.RequestException:
+        pass
+
+def close_http_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+def iter_periods(start, end):
+    """Yield (month, year) for every month between two dates, both inclusive."""
+    month, year = start.month, start.year
+    while (year, month) <= (end.year, end.month):
+        yield month, year
+        month += 1
+        if month > 12:
+            month, year = 1, year + 1
+
+def entity_ids(auth_data: dict, only=None) -> list:
+    """EntidadId of every entry in EntidadesContacto, optionally restricted to `only`."""
+    ids = [e.get("EntidadId") for e in auth_data.get("EntidadesContacto") or []]
+    if only is not None:
+        wanted = set(only)
+        ids = [eid for eid in ids if eid in wanted]
+    return ids
+
+def tag_records(records, **tags) -> list:
+    """Stamp each record with the given fields so merged results stay traceable."""
+    records = records or []
+    for rec in records:
+        rec.update(tags)
+    return records
 
 class ScrapeManager:
     def __init__(self, login_state: LoginState, config: ScrapeConfig = None): # type: ignore
         self.login_state = login_state
         self.config = config if config is not None else ScrapeConfig()
+        self.session = get_http_session(self.config.pool_size)
+        self.transport = Transport(self.session, self.config)
+        self.on_token = None  # callback(login_state) after every successful authentication
+        self._auth_lock = threading.Lock()
         self.headers = {
             "Accept": "*/*",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
             "Content-Type": "application/json",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:134.0) Gecko/20100101 Firefox/134.0"
         }
 
     def fetch_secret_key(self, url: str = None) -> str: # type: ignore
         url = url or self.config.secret_key_url
-        response = requests.get(url, headers=self.headers)
+        with span("scrape.fetch_secret_key") as t:
+            response = self.transport.request("GET", url, idempotent=True, hedge=True, headers=self.headers)
+            t.update(status=response.status_code, bytes=len(response.content))
         if response.status_code == 200:
             secret_key_data = response.json()
             secret_key = secret_key_data.get("Valor")
@@ -29,17 +119,27 @@ class ScrapeManager:
             return secret_key
         else:
             print(f"Failed to retrieve secretKey. Status Code: {response.status_code}")
-            print("Response Text:", response.text)
-            exit()
+            raise TransportError(f"No se pudo obtener la clave del servidor ({response.status_code})")
 
-    def authenticate(self, auth_url: str = None, secret_key_url: str = None) -> dict: # type: ignore
-        # If token is already stored, reuse it
-        if self.login_state.token is not None:
+    def authenticate(self, auth_url: str = None, secret_key_url: str = None, force: bool = False) -> dict: # type: ignore
+        # If a still valid token is stored, reuse it
+        if not force and self.login_state.token_valid():
             print("Using cached token.")
-            return {
-                "Token": self.login_state.token,
-                "EntidadesContacto": [{"EntidadId": self.login_state.entity_id}]
-            }
+            return self._cached_auth_data()
+        stale_token = self.login_state.token
+        with self._auth_lock:
+            # Another thread may have renewed the token while we waited for the lock.
+            if self.login_state.token is not None and self.login_state.token != stale_token and self.login_state.token_valid():
+                return self._cached_auth_data()
+            return self._authenticate(auth_url, secret_key_url)
+
+    def _cached_auth_data(self) -> dict:
+        return {
+            "Token": self.login_state.token,
+            "EntidadesContacto": [{"EntidadId": eid} for eid in self.login_state.entity_ids]
+        }
+
+    def _authenticate(self, auth_url: str = None, secret_key_url: str = None) -> dict: # type: ignore
         auth_url = auth_url or self.config.auth_url
         secret_key_url = secret_key_url or self.config.secret_key_url
         auth_data = {
@@ -47,19 +147,30 @@ class ScrapeManager:
             "Clave": self.login_state.credentials.get("password"),
             "secretKey": self.fetch_secret_key(secret_key_url)
         }
-        auth_response = requests.post(auth_url, headers=self.headers, json=auth_data)
+        with span("scrape.authenticate") as t:
+            auth_response = self.transport.request("POST", auth_url, headers=self.headers, json=auth_data)
+            t.update(status=auth_response.status_code, bytes=len(auth_response.content))
         if auth_response.status_code == 200:
             auth_response_data = auth_response.json()
             print("Login Successful!")
-            print("Response:", auth_response_data)
-            # Cache the token and entity id in state
-            self.login_state.token = auth_response_data.get("Token")
-            self.login_state.entity_id = auth_response_data.get("EntidadesContacto")[0].get("EntidadId")  # type: ignore
+            # Cache the token, entity ids and expiry in state
+            token = auth_response_data.get("Token")
+            issued_at = time.time()
+            self.login_state.set_token(
+                token,
+                entity_ids(auth_response_data),
+                expires_at=token_expiry(token, issued_at, self.login_state.token_lifetime),
+                issued_at=issued_at,
+            )
+            if self.on_token is not None:
+                self.on_token(self.login_state)
             return auth_response_data
+        elif auth_response.status_code in (400, 401, 403):
+            print(f"Login failed with status code {auth_response.status_code}")
+            raise AuthError("Usuario o contraseña incorrectos")
         else:
             print(f"Login failed with status code {auth_response.status_code}")
-            print("Response Text:", auth_response.text)
-            raise Exception("Authentication failed")
+            raise TransportError(f"Error del servidor al autenticar ({auth_response.status_code})")
 
     def fetch_management_data(
         self,
@@ -68,10 +179,55 @@ class ScrapeManager:
         year: int,
         entity: int,
         incl_approved_doc: bool = True,
-        management_url: str = None # type: ignore
+        management_url: str = None, # type: ignore
+        retry_on_401: bool = True
     ) -> dict:
         management_url = management_url or self.config.management_url
-        self.headers["Authorization"] = f"Bearer {token}"
+        # Per-request headers so concurrent calls never share a mutated dict.
+        headers = {**self.headers, "Authorization": f"Bearer {token}"}
+        management_data = {
+            "Periodo": {
+                "Mes": month,
+                "A\u00f1o": year,
+                "EntidadId": entity
+            },
+            "IncluirDocumentacionAprobada": incl_approved_doc
+        }
+        with span("scrape.fetch_management_data", entity=entity, month=month, year=year) as t:
+            # Read-only query: safe to retry and hedge.
+            response = self.transport.request(
+                "POST", management_url, idempotent=True, hedge=True, headers=headers, json=management_data
+            )
+            t.update(status=response.status_code, bytes=len(response.content))
+        if response.status_code == 401 and retry_on_401:
+            # Token expired server side: learn its lifetime, re-authenticate and retry once.
+            self._token_rejected()
+            auth_data = self.authenticate(force=True)
+            return self.fetch_management_data(
+                auth_data.get("Token"), month, year, entity, incl_approved_doc, management_url, retry_on_401=False  # type: ignore
+            )
+        if response.status_code == 401:
+            raise AuthError("Sesión expirada")
+        if response.status_code != 200:
+            raise DataError(f"Error al obtener la documentación ({response.status_code})")
+        with span("scrape.decode_json", bytes=len(response.content)) as t:
+            data = response.json()
+            t["records"] = len(data) if isinstance(data, list) else None
+        return data
+
+    def iter_management_data(
+        self,
+        token: str,
+        month: int,
+        year: int,
+        entity: int,
+        incl_approved_doc: bool = True,
+        management_url: str = None, # type: ignore
+        chunk_size: int = 64 * 1024
+    ):
+        """Like fetch_management_data, but yields each record as soon as it has been
+        downloaded and decoded instead of buffering the whole response."""
+        management_url = management_url or self.config.management_url
         management_data = {
             "Periodo": {
                 "Mes": month,
@@ -80,30 +236,263 @@ class ScrapeManager:
             },
             "IncluirDocumentacionAprobada": incl_approved_doc
         }
-        response = requests.post(management_url, headers=self.headers, json=management_data)
-        return response.json()
+        for attempt in (0, 1):
+            headers = {**self.headers, "Authorization": f"Bearer {token}"}
+            with span("scrape.stream_management_data", entity=entity, month=month, year=year) as t:
+                with self.transport.request("POST", management_url, idempotent=True, headers=headers,
+                                            json=management_data, stream=True) as response:
+                    t["status"] = response.status_code
+                    if response.status_code == 401 and attempt == 0:
+                        self._token_rejected()
+                        token = self.authenticate(force=True).get("Token")  # type: ignore
+                        continue
+                    if response.status_code == 401:
+                        raise AuthError("Sesión expirada")
+                    if response.status_code != 200:
+                        raise DataError(f"Error al obtener la documentación ({response.status_code})")
+                    count = 0
+                    for record in iter_json_array(response.iter_content(chunk_size=chunk_size)):
+                        count += 1
+                        yield record
+                    t["records"] = count
+            return
+
+    def _token_rejected(self):
+        state = self.login_state
+        if state.token_expires_at is None and state.token_issued_at is not None:
+            state.token_lifetime = time.time() - state.token_issued_at
+        state.clear_token()
+        if not state.credentials.get("password"):
+            raise AuthError("Sesión expirada, ingrese nuevamente")
 
-    def scrape(self, management_url: str = None): # type: ignore
+    def scrape(self, management_url: str = None, entities=None): # type: ignore
         auth_data = self.authenticate()
-        entity = auth_data.get("EntidadesContacto")[0].get("EntidadId")  # type: ignore
-        print("Entity ID:", entity)
-        return self.fetch_management_data(
-            token=auth_data.get("Token"),  # type: ignore
-            month=datetime.now().month,
-            year=datetime.now().year,
-            entity=entity,
-            management_url=management_url
+        combined = []
+        for entity in entity_ids(auth_data, entities):
+            print("Entity ID:", entity)
+            records = self.fetch_management_data(
+                token=auth_data.get("Token"),  # type: ignore
+                month=datetime.now().month,
+                year=datetime.now().year,
+                entity=entity,
+                management_url=management_url
+            )
+            combined.extend(tag_records(records, EntidadId=entity))
+        return combined
+
+class AsyncScrapeManager:
+    """Awaitable counterpart of ScrapeManager. Each blocking round-trip runs in a worker
+    thread over the shared pooled session, so the Flet event loop stays responsive."""
+
+    def __init__(self, login_state: LoginState, config: ScrapeConfig = None, cache=None): # type: ignore
+        if config is not None and config.pool_size < config.max_concurrency:
+            # Copy: the caller's config may be shared with other managers.
+            config = replace(config, pool_size=config.max_concurrency)
+        self.sync = ScrapeManager(login_state, config)
+        self.login_state = login_state
+        self.config = self.sync.config
+        self.cache = cache  # optional ResponseCache
+        self._flight = SingleFlight()
+
+    async def fetch_secret_key(self, url: str = None) -> str: # type: ignore
+        return await asyncio.to_thread(self.sync.fetch_secret_key, url)
+
+    async def authenticate(self, auth_url: str = None, secret_key_url: str = None, force: bool = False) -> dict: # type: ignore
+        if not force and self.login_state.token_valid():
+            return await asyncio.to_thread(self.sync.authenticate, auth_url, secret_key_url)
+
+        # Every task needing a token while one is being fetched shares that request.
+        return await self._flight.do(
+            ("auth", auth_url, secret_key_url),
+            lambda: asyncio.to_thread(self.sync.authenticate, auth_url, secret_key_url, force),
         )
 
-# Usage example:
+    async def keep_token_fresh(self, margin: float = 120, fallback_interval: float = 1800, retry_base: float = 30):
+        """Renew the token `margin` seconds before it expires until cancelled. Run it as a
+        background task; without a known expiry it renews every `fallback_interval`.
+        Rejected credentials (AuthError) end the loop; network failures back off
+        exponentially with jitter, starting at `retry_base` seconds."""
+        failures = 0
+        while True:
+            if failures:
+                delay = random.uniform(retry_base, min(fallback_interval, retry_base * 2 ** failures))
+            else:
+                expires_at = self.login_state.token_expires_at
+                delay = fallback_interval if expires_at is None else expires_at - margin - time.time()
+            await asyncio.sleep(max(delay, 5))
+            if not self.login_state.credentials.get("password"):
+                # Restored session without a password: nothing to renew with.
+                return
+            try:
+                await self.authenticate(force=True)
+                failures = 0
+            except AuthError as e:
+                print("Token renewal rejected:", e)
+                return
+            except TransportError as e:
+                failures += 1
+                print("Token renewal failed:", e)
+
+    async def fetch_management_data(
+        self,
+        token: str,
+        month: int,
+        year: int,
+        entity: int,
+        incl_approved_doc: bool = True,
+        management_url: str = None, # type: ignore
+        fresh: bool = False
+    ) -> dict:
+        """`fresh` skips reading the cache (the response is still written to it)."""
+        key = ("management", entity, month, year, incl_approved_doc, management_url, fresh)
+        return await self._flight.do(key, lambda: asyncio.to_thread(
+            self._fetch_management_data_cached, token, month, year, entity, incl_approved_doc, management_url, fresh
+        ))
+
+    def _fetch_management_data_cached(self, token, month, year, entity, incl_approved_doc, management_url, fresh=False):
+        if self.cache is None:
+            return self.sync.fetch_management_data(token, month, year, entity, incl_approved_doc, management_url)
+        key = self.cache.management_key(entity, month, year, incl_approved_doc)
+        if not fresh:
+            cached = self.cache.get(key, max_age=self.cache.ttl_for(month, year))
+            if cached is not None:
+                return cached
+        try:
+            data = self.sync.fetch_management_data(token, month, year, entity, incl_approved_doc, management_url)
+        except TransportError:
+            # API down or circuit open: fall back to the last known data if any. A fresh
+            # fetch re-raises instead: the caller already shows that data and needs to know.
+            stale = None if fresh else self.cache.get(key, allow_stale=True)
+            if stale is None:
+                raise
+            print("Serving cached data:", key)
+            return stale
+        self.cache.set(key, data)
+        return data
+
+    async def stream_scrape(self, entities=None, batch_size: int = 200, management_url: str = None): # type: ignore
+        """Async iterator over batches of DocumentRecords for the current month of every
+        entity, yielded while the responses are still downloading. With a cache the raw
+        records are also kept and stored once each entity completes."""
+        from modules.data.records import DocumentRecord
+
+        auth_data = await self.authenticate()
+        token = auth_data.get("Token")
+        ids = entity_ids(auth_data, entities)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, self._entities_cache_key(), entity_ids(auth_data))
+        now = datetime.now()
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        done = object()
+        stopped = threading.Event()  # consumer went away: producers stop reading
+
+        def put(item):
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        def produce(entity):
+            raw_records = [] if self.cache is not None else None
+            batch = []
+            try:
+                for raw in self.sync.iter_management_data(token, now.month, now.year, entity, management_url=management_url):  # type: ignore
+                    if stopped.is_set():
+                        return
+                    raw.update(EntidadId=entity, PeriodoMes=now.month, PeriodoAnio=now.year)
+                    if raw_records is not None:
+                        raw_records.append(raw)
+                    batch.append(DocumentRecord(raw))
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                if batch:
+                    put(batch)
+                if raw_records is not None:
+                    self.cache.set(self.cache.management_key(entity, now.month, now.year), raw_records)  # type: ignore
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def run(entity):
+            async with semaphore:
+                await asyncio.to_thread(produce, entity)
+
+        tasks = [asyncio.ensure_future(run(entity)) for entity in ids]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            for task in tasks:
+                task.cancel()
+
+    def _entities_cache_key(self):
+        return self.cache.entities_key(self.login_state.credentials.get("email"))
+
+    async def scrape(self, management_url: str = None, entities=None, fresh: bool = False): # type: ignore
+        """Fetch the current month for every entity (or only `entities`) under one token."""
+        now = datetime.now()
+        return await self.scrape_range(now, now, management_url=management_url, entities=entities, fresh=fresh)
+
+    async def iter_range(self, start, end, incl_approved_doc: bool = True, management_url: str = None, entities=None, fresh: bool = False): # type: ignore
+        """Fetch every (entity, period) between start and end concurrently (bounded by
+        config.max_concurrency) and yield ((entity, month, year), records) as each one completes."""
+        auth_data = await self.authenticate()
+        token = auth_data.get("Token")
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, self._entities_cache_key(), entity_ids(auth_data))
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def fetch_one(entity, month, year):
+            async with semaphore:
+                records = await self.fetch_management_data(
+                    token=token,  # type: ignore
+                    month=month,
+                    year=year,
+                    entity=entity,
+                    incl_approved_doc=incl_approved_doc,
+                    management_url=management_url,
+                    fresh=fresh
+                )
+            tag_records(records, EntidadId=entity, PeriodoMes=month, PeriodoAnio=year)
+            return (entity, month, year), records or []
+
+        tasks = [
+            asyncio.ensure_future(fetch_one(entity, m, y))
+            for entity in entity_ids(auth_data, entities)
+            for m, y in iter_periods(start, end)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def scrape_range(self, start, end, incl_approved_doc: bool = True, management_url: str = None, entities=None, fresh: bool = False): # type: ignore
+        """Merge all entities and periods between start and end into a single record list."""
+        merged = []
+        async for _key, records in self.iter_range(start, end, incl_approved_doc, management_url, entities, fresh):
+            merged.extend(records)
+        return merged
+
+# Usage example (see src/export.py for the headless exporter):
 if __name__ == "__main__":
-    # Create a LoginState instance and set the credentials
-    from modules.core.state import LoginState
+    import os
     state = LoginState()
-    state.credentials["email"] = "my_username"
-    state.credentials["password"] = "my_password"
-    
+    state.credentials["email"] = os.environ["DOCUX_EMAIL"]
+    state.credentials["password"] = os.environ["DOCUX_PASSWORD"]
+
     # Create an instance of ScrapeManager with the state and (optionally) a custom config
     manager = ScrapeManager(login_state=state)
     result = manager.scrape()
-    print(result)
+    print(f"{len(result)} records")
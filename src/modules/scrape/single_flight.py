@@ -0,0 +1,25 @@
+import asyncio
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key: the first caller runs the
+    coroutine, every caller arriving while it is in flight awaits the same result."""
+
+    def __init__(self):
+        self._inflight = {}
+
+    def in_flight(self, key) -> bool:
+        return key in self._inflight
+
+    async def do(self, key, coro_fn):
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f, key=key: self._forget(key, f))
+        # shield: a cancelled waiter must not cancel the call the others share.
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
@@ -0,0 +1,75 @@
+import codecs
+import json
+
+from modules.core.exceptions import DataError
+
+_WHITESPACE = " \t\n\r"
+# Characters that can continue a number ("1." then "5e3").
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+def iter_json_array(chunks, trim_at: int = 1 << 16):
+    """Yield the elements of a top-level JSON array from an iterable of byte
+    chunks, decoding each element as soon as it is complete instead of
+    buffering the whole body. Elements must be separated by exactly one comma;
+    anything else raises DataError."""
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    expect = None  # None before "[", then "first", "value" (after a comma) or "sep"
+    exhausted = False
+
+    def more() -> bool:
+        nonlocal buf, pos, exhausted
+        for chunk in chunks:
+            if chunk:
+                if pos > trim_at:
+                    buf, pos = buf[pos:], 0
+                buf += utf8.decode(chunk)
+                return True
+        buf += utf8.decode(b"", final=True)
+        exhausted = True
+        return False
+
+    while True:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buf):
+            if exhausted or not more():
+                raise DataError("Respuesta incompleta del servidor")
+            continue
+        char = buf[pos]
+        if expect is None:
+            if char != "[":
+                raise DataError("Se esperaba una lista en la respuesta")
+            expect = "first"
+            pos += 1
+        elif char == "]":
+            if expect == "value":
+                raise DataError("Respuesta JSON inválida")
+            return
+        elif char == ",":
+            if expect != "sep":
+                raise DataError("Respuesta JSON inválida")
+            expect = "value"
+            pos += 1
+        elif expect == "sep":
+            raise DataError("Respuesta JSON inválida")
+        else:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element not fully received yet.
+                if exhausted or not more():
+                    raise DataError("Respuesta JSON inválida")
+                continue
+            if (not exhausted and isinstance(item, (int, float))
+                    and not buf[end:].lstrip(_NUMBER_CHARS)):
+                # A number could continue in the next chunk; records are objects, so rare.
+                if more():
+                    continue
+            pos = end
+            expect = "sep"
+            yield item
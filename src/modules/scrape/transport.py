@@ -0,0 +1,132 @@
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+
+from modules.core.exceptions import CircuitOpenError, RequestTimeoutError, ServiceUnavailableError
+
+# Status codes worth retrying on idempotent calls.
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures and rejects calls for
+    `reset_timeout` seconds; then lets one trial call through (half-open)."""
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def before_call(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial:
+                raise CircuitOpenError("El servidor no responde, se reintentará en unos segundos")
+            self._trial = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+# One breaker per API host, shared by every Transport.
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(url: str, threshold: int = 5, reset_timeout: float = 30) -> CircuitBreaker:
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(threshold, reset_timeout)
+        return breaker
+
+
+class Transport:
+    """HTTP calls with per-call timeouts, bounded retries with jittered exponential
+    backoff for idempotent calls, a per-host circuit breaker and optional hedging.
+
+    Errors surface as the TransportError subclasses of modules.core.exceptions.
+    HTTP error statuses that are not retried are returned to the caller as is.
+    """
+
+    _hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+    def __init__(self, session: requests.Session, config):
+        self.session = session
+        self.config = config
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform between 0 and the exponential ceiling.
+        return random.uniform(0, min(self.config.backoff_max, self.config.backoff_base * 2 ** attempt))
+
+    def request(self, method: str, url: str, idempotent: bool = False, hedge: bool = False, **kwargs) -> requests.Response:
+        breaker = get_breaker(url, self.config.breaker_threshold, self.config.breaker_reset)
+        kwargs.setdefault("timeout", self.config.timeout)
+        attempts = self.config.max_retries + 1 if idempotent else 1
+        for attempt in range(attempts):
+            breaker.before_call()
+            last = attempt == attempts - 1
+            try:
+                if hedge and idempotent and self.config.hedge_after and not kwargs.get("stream"):
+                    response = self._hedged(method, url, **kwargs)
+                else:
+                    response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                breaker.record_failure()
+                if last and isinstance(e, requests.Timeout):
+                    raise RequestTimeoutError(f"Tiempo de espera agotado: {urlsplit(url).path}") from e
+                if last:
+                    raise ServiceUnavailableError(f"No se pudo conectar con {urlsplit(url).netloc}") from e
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                if response.status_code not in RETRY_STATUS or not idempotent:
+                    return response
+                if last:
+                    response.close()
+                    raise ServiceUnavailableError(f"El servidor respondió {response.status_code}")
+                response.close()
+            time.sleep(self.backoff(attempt))
+        raise ServiceUnavailableError("Sin respuesta del servidor")  # not reached
+
+    def _hedged(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a second identical request if the first has not answered after
+        config.hedge_after seconds; return whichever finishes first."""
+        first = self._hedge_pool.submit(self.session.request, method, url, **kwargs)
+        done, _ = wait([first], timeout=self.config.hedge_after)
+        if done:
+            return first.result()
+        second = self._hedge_pool.submit(self.session.request, method, url, **kwargs)
+        pending = {first, second}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error  # type: ignore
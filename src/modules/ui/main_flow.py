@@ -1,19 +1,51 @@
 import datetime
+import os
+import threading
+import time
 import flet as ft
-import pprint
 import asyncio
 
 from modules.auth import AuthManager, SessionManager
 from modules.core.state import LoginState
-from modules.ui_helpers import show_error, loading_indicator
-from modules.scrape.scrape_manager import ScrapeManager
+from modules.core.exceptions import AuthError
+from modules.ui_helpers import show_error, show_notification, loading_indicator
+from modules.scrape.scheduler import RefreshScheduler
+from modules.ui.table_view import DocumentTable
+from modules.data.records import SORT_ORDER, normalize_records
+from modules.data.index import RecordIndex
+from modules.data.history_store import HistoryStore
+from modules.data.expiry import ExpiryEngine
+from modules.core.timing import configure_timing, record, span, start_run
+from modules.ui.perf_overlay import PerfOverlay
+
+# requests and cryptography are imported lazily (see _warm_up) so the first
+# frame is not held back by them.
 
 class MainFlow:
-    def __init__(self, page: ft.Page):  # Asegurar tipo Page
+    def __init__(self, page: ft.Page, started: float = None):  # Asegurar tipo Page  # type: ignore
         self.page = page
+        self.started = started if started is not None else time.perf_counter()
+        self._first_paint = False
         self.state = LoginState()
         self.session_manager = SessionManager(page)
         self.auth_manager = AuthManager(self.state)
+        self.table = None
+        self.index = RecordIndex()
+        self.search_field = None
+        self.estado_filter = None
+        self.servicio_filter = None
+        self._filter_task = None
+        self.scheduler = None
+        self._renew_task = None
+        self.history = None
+        self.accounts = None
+        self.show_account = False
+        self.expiry = ExpiryEngine(self.EXPIRY_THRESHOLDS, on_alert=self._notify_expiry)
+        self._expiry_task = None
+        self.page.on_app_lifecycle_state_change = self._on_lifecycle_change
+        configure_timing()
+        # Set DOCUX_PERF_OVERLAY=1 to show the timing breakdown of the last run.
+        self.perf_overlay = PerfOverlay(page) if os.environ.get("DOCUX_PERF_OVERLAY") else None
         self.stay_logged_in = False
         
         # Initialize stay_logged_in to a default value
@@ -27,22 +59,54 @@ class MainFlow:
         self.page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
 
     async def run(self):
+        threading.Thread(target=self._warm_up, daemon=True).start()
         try:
+            if not os.path.exists(self.session_manager.session_file):
+                # Nothing to restore: paint the form before touching any crypto.
+                await self._show_login_form()
+                return
             session = await self.session_manager.load_session()
-            if session:
-                # Call _on_login with the loaded session credentials.
+            if session and self.session_manager.restore_state(session, self.state):
+                # Warm start: the persisted token is still valid, go straight to the data call.
+                self.state.credentials["keep_logged_in"] = True
+                loading_indicator(self.page, "Cargando...")
+                await self._load_data()
+                return
+            if session and session.get("password"):
+                # Legacy session that still carries credentials: the user chose to stay
+                # logged in, so the token-only session replaces it after this login.
+                self.state.credentials["keep_logged_in"] = True
                 await self._on_login(session["email"], session["password"])
                 return
             await self._show_login_form()
         except Exception as e:
             await self._show_login_form()
 
+    @staticmethod
+    def _warm_up():
+        """Import the HTTP and crypto stacks and open the API connection in the background."""
+        with span("startup.warm_up"):
+            from modules.auth.encryption import get_fernet
+            from modules.scrape.scrape_manager import warm_up
+            get_fernet()
+            warm_up()
 
+    def _mark_first_paint(self, what: str):
+        if not self._first_paint:
+            self._first_paint = True
+            record("startup.first_paint", (time.perf_counter() - self.started) * 1000, view=what)
 
-    async def _show_login_form(self):
+    async def _show_login_form(self, email: str = None): # type: ignore
         """Muestra el formulario de login"""
+        self._stop_refresh()
+        self._stop_token_renewal()
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
         self.page.clean()
-        email_field = ft.TextField(label="Email")
+        self.table = None
+        self.search_field = self.estado_filter = self.servicio_filter = None
+        email_field = ft.TextField(label="Email", value=email)
         password_field = ft.TextField(label="Contraseña", password=True)
         # Assign checkbox to self so we can read its value later
         self.stay_logged_in = ft.Checkbox(label="Mantenerse conectado")
@@ -66,179 +130,392 @@ class MainFlow:
             )
         )
         self.page.update()
+        self._mark_first_paint("login")
 
     async def _on_login(self, email: str, password: str):
         try:
+            start_run("login")
             loading_indicator(self.page, "Validando...")
             self.state.credentials.update({"email": email, "password": password})
             await self.auth_manager.validate_credentials(self.state.credentials)
-            
-            # Save session if "stay logged in" is selected.
+            self.state.clear_token()
             if getattr(self, "stay_logged_in", None) and self.stay_logged_in.value: # type: ignore
-                self.session_manager.save_session(self.state.credentials)
-            
-            # Continue with scraping and loading main content.
-            scrape_manager = ScrapeManager(self.state)
-            scrape_result = scrape_manager.scrape()  # synchronous call
-            pprint.pp(scrape_result)  # type: ignore
-            self._load_main_content(scrape_data=scrape_result)
-            
+                self.state.credentials["keep_logged_in"] = True
         except Exception as e:
             show_error(self.page, str(e))
             await self._show_login_form()
+            return
+        await self._load_data()
 
+    async def _load_data(self):
+        cached_result = None
+        cached_records = scrape_manager = None
+        self._stop_token_renewal()
+        try:
+            from modules.scrape.cache import ResponseCache
+            cache = ResponseCache()
+            # Paint the last known table right away, before the HTTP stack is needed.
+            cached_result = await asyncio.to_thread(cache.current_records, self.state.credentials.get("email"))
+            if cached_result:
+                cached_records = await self._load_main_content(scrape_data=cached_result)
+                self._mark_first_paint("snapshot")
 
+            from modules.scrape.scrape_manager import AsyncScrapeManager
+            scrape_manager = AsyncScrapeManager(self.state, cache=cache)
+            # Save the token (never the password) whenever it is obtained or renewed.
+            if self.state.credentials.get("keep_logged_in"):
+                scrape_manager.sync.on_token = self._persist_token
+            self.show_account = False
 
-    # Define the sort order for Estado values.
-    SORT_ORDER = {
-        "Vencido": 0,
-        "Pendiente": 1,
-        "Pendiente aprobación": 2,
-        "Aprobado": 3,
-    }
+            if cached_result:
+                with span("ui.scrape") as t:
+                    scrape_result = await scrape_manager.scrape()
+                    t["records"] = len(scrape_result)
+            else:
+                # Nothing on screen yet: show rows while the response is still downloading.
+                scrape_result = await self._stream_into_table(scrape_manager)
+            records = await self._load_main_content(scrape_data=scrape_result)
+            self._store_history(records)
+            self._mark_first_paint("table")
+            self._keep_current(scrape_manager, records)
+        except AuthError as e:
+            await self._session_expired(e)
+        except Exception as e:
+            # Network trouble: keep the cached table if there is one, and let the
+            # scheduler's backoff retry until the API answers again.
+            show_error(self.page, str(e))
+            if not cached_result:
+                await self._show_login_form()
+            elif scrape_manager is not None:
+                self._keep_current(scrape_manager, cached_records, failed=True)
 
-    # sort_key remains as before.
-    def sort_key(self, rec):
-        archivo = rec.get("Archivo", {})
-        estado = archivo.get("EstadoDenominacion", "")
-        base_order = self.SORT_ORDER.get(estado, 99)
-        if estado == "Aprobado":
-            fecha_str = archivo.get("FechaVencimiento", "")
-            try:
-                fecha_str = fecha_str.strip()
-                if "T" in fecha_str:
-                    fecha = datetime.datetime.strptime(fecha_str, "%Y-%m-%dT%H:%M:%S%z").date()
+    def _keep_current(self, scrape_manager, records, failed: bool = False):
+        """Start token renewal and background refreshes for the table on screen."""
+        self._renew_task = asyncio.ensure_future(scrape_manager.keep_token_fresh())
+        self._start_refresh(lambda: scrape_manager.scrape(fresh=True), records, failed)
+
+    async def _session_expired(self, error):
+        """The saved token was rejected: forget it and ask for credentials again,
+        even if a cached table is on screen."""
+        self.session_manager.clear_session()
+        show_error(self.page, str(error))
+        await self._show_login_form()
+
+    def _stop_token_renewal(self):
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            self._renew_task = None
+
+
+
+    async def _stream_into_table(self, scrape_manager):
+        records = []
+        with span("ui.stream_scrape") as t:
+            start = time.perf_counter()
+            async for batch in scrape_manager.stream_scrape():
+                if self.table is None or self.table.list_view.page is None:
+                    t["first_rows_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                    await self._load_main_content(scrape_data=batch)
+                    self._mark_first_paint("first_rows")
                 else:
-                    fecha = datetime.datetime.strptime(fecha_str, "%Y-%m-%d").date()
-                days_left = (fecha - datetime.date.today()).days
-            except Exception:
-                days_left = float("inf")
-            return (base_order, days_left)
+                    self.table.extend_records(batch)
+                    self.table.list_view.update()
+                records.extend(batch)
+            t["records"] = len(records)
+        return records
+
+    def _persist_token(self, state):
+        self.session_manager.save_state(state)
+        self._account_store().save_state(state)
+
+    def _account_store(self):
+        if self.accounts is None:
+            from modules.auth import AccountStore
+            self.accounts = AccountStore()
+        return self.accounts
+
+    async def _show_all_accounts(self, e):
+        """Scrape every saved account at once into one table with a Cuenta column."""
+        from modules.scrape.account_pool import AccountPool
+        from modules.scrape.cache import ResponseCache
+        start_run("accounts")
+        self._stop_refresh()
+        pool = AccountPool(self._account_store(), cache=ResponseCache())
+
+        async def scrape_accounts(fresh=False):
+            with span("ui.scrape_accounts") as t:
+                records, errors = await pool.scrape_all(fresh=fresh)
+                t.update(records=len(records), failed=len(errors))
+            expired = [email for email, err in errors.items() if isinstance(err, AuthError)]
+            others = [str(err) for err in errors.values() if not isinstance(err, AuthError)]
+            if expired and not fresh:
+                self._show_expired_accounts(expired)
+            elif expired:
+                others.append("Ingrese nuevamente con: " + ", ".join(expired))
+            if others:
+                show_error(self.page, " / ".join(others))
+            return records
+
+        self.show_account = True
+        records = await self._load_main_content(scrape_data=await scrape_accounts())
+        self._store_history(records)
+        self._start_refresh(lambda: scrape_accounts(fresh=True), records)
+
+    def _start_refresh(self, fetch, records, failed: bool = False):
+        """Keep the table current with background refreshes; `fetch` is an async
+        callable returning fresh (uncached) records."""
+        self._stop_refresh()
+        self.scheduler = RefreshScheduler(
+            refresh=lambda: self._timed_refresh(fetch),
+            on_result=self._on_refresh_result,
+            on_error=self._on_refresh_error,
+        )
+        self.scheduler.start(records, failed)
+
+    async def _timed_refresh(self, fetch):
+        start_run("refresh")
+        with span("ui.scrape") as t:
+            result = await fetch()
+            t["records"] = len(result)
+        return result
+
+    def _on_refresh_error(self, error):
+        if isinstance(error, AuthError):
+            # The scheduler has already stopped; the token will not come back.
+            self.scheduler = None
+            self.page.run_task(self._session_expired, error)
         else:
-            return (base_order, 0)
+            print("Background refresh failed:", error)
+            if self.scheduler is not None and self.scheduler.failures == 1:
+                # Tell once per outage; the scheduler keeps retrying with backoff.
+                show_error(self.page, "No se pudo actualizar, se muestran los últimos datos guardados")
+
+    async def _on_refresh_result(self, scrape_data):
+        records = await self._load_main_content(scrape_data=scrape_data)
+        self._store_history(records)
+        return records
+
+    def _history_store(self) -> HistoryStore:
+        if self.history is None:
+            self.history = HistoryStore()
+        return self.history
+
+    def _store_history(self, records):
+        # Every fetched period is kept locally for the history view.
+        if records:
+            self.page.run_thread(self._history_store().upsert, records)
+        self._track_expiry(records)
+
+    def _track_expiry(self, records):
+        """Feed a complete result to the expiry engine and fire the alerts now due."""
+        with span("ui.expiry_update", records=len(records or [])):
+            self.expiry.update(records or [])
+            self.expiry.due_alerts()
+        if self._expiry_task is None:
+            self._expiry_task = asyncio.ensure_future(self._expiry_tick())
+
+    async def _expiry_tick(self):
+        # Thresholds are crossed as days pass, even without new data.
+        while True:
+            await asyncio.sleep(self.EXPIRY_CHECK_INTERVAL)
+            self.expiry.due_alerts()
+
+    def _notify_expiry(self, alerts):
+        today = datetime.date.today()
+        alerts = sorted(alerts, key=lambda alert: alert[0].expires)
+        lines = [
+            f"{(record.expires - today).days} días: {record.documento} {record.patente or record.denominacion}".strip()
+            for record, _threshold in alerts[:5]
+        ]
+        if len(alerts) > 5:
+            lines.append(f"... y {len(alerts) - 5} más")
+        show_notification(self.page, f"Documentos por vencer ({len(alerts)}):\n" + "\n".join(lines))
+
+    def _stop_refresh(self):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
+
+    def _on_lifecycle_change(self, e):
+        # Do not poll the API while the window is hidden.
+        if self.scheduler is None:
+            return
+        if e.state in (ft.AppLifecycleState.HIDE, ft.AppLifecycleState.PAUSE):
+            self.scheduler.pause()
+        elif e.state in (ft.AppLifecycleState.SHOW, ft.AppLifecycleState.RESUME):
+            self.scheduler.resume()
+
+    # Sort order for Estado values.
+    SORT_ORDER = SORT_ORDER
+    # Seconds to wait after the last keystroke before filtering.
+    FILTER_DEBOUNCE = 0.25
+    # Horizon of the "expiring soon" list in the history view.
+    HISTORY_EXPIRY_DAYS = 30
+    # Days before expiry at which an approved document raises a notification.
+    EXPIRY_THRESHOLDS = (30, 15, 7, 1)
+    # Seconds between checks of the alert calendar.
+    EXPIRY_CHECK_INTERVAL = 3600
+
+    def sort_key(self, rec):
+        return rec.sort_key()
+
+    def _build_filter_bar(self):
+        self.search_field = ft.TextField(label="Buscar", width=300, on_change=self._on_filter_change)
+        self.estado_filter = ft.Dropdown(label="Estado", width=220, on_change=self._on_filter_change)
+        self.servicio_filter = ft.Dropdown(label="Servicio", width=300, on_change=self._on_filter_change)
+        self._update_filter_options()
+        history_btn = ft.OutlinedButton("Historial", on_click=self._show_history)
+        add_account_btn = ft.OutlinedButton("Agregar cuenta", on_click=self._on_add_account)
+        buttons = [history_btn, add_account_btn]
+        if len(self._account_store()) > 1:
+            buttons.append(ft.OutlinedButton("Todas las cuentas", on_click=self._show_all_accounts))
+        return ft.Row(
+            controls=[self.search_field, self.estado_filter, self.servicio_filter, *buttons],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
 
-    def _build_custom_table_rows(self, scrape_data):
-        # Header row with five columns:
-        # 1) Estado, 2) Denominación, 3) Patente, 4) Documento, 5) Servicio.
-        header = ft.Container(
-            content=ft.Row(
+    async def _show_history(self, e):
+        """Vencido trend per period and documents expiring soon, from the local store."""
+        store = self._history_store()
+        with span("ui.history_query"):
+            counts = await asyncio.to_thread(store.estado_counts, "Vencido")
+            expiring = await asyncio.to_thread(store.expiring_within, self.HISTORY_EXPIRY_DAYS)
+
+        def text(value, width=120):
+            return ft.Text(str(value), width=width, color=ft.colors.WHITE)
+
+        trend = [ft.Row([text(f"{c['month']:02d}/{c['year']}"), text(c["total"])]) for c in counts]
+        upcoming = [
+            ft.Row([text(doc["vencimiento"]), text(doc["patente"] or doc["denominacion"], 160),
+                    text(doc["documento"], 200), text(doc["servicio"], 200)])
+            for doc in expiring
+        ]
+        dialog = ft.AlertDialog(
+            title=ft.Text("Historial"),
+            content=ft.Column(
                 controls=[
-                    ft.Text("Estado", weight="bold", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE), # type: ignore
-                    ft.Text("Denominación", weight="bold", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE), # type: ignore
-                    ft.Text("Patente", weight="bold", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE), # type: ignore
-                    ft.Text("Documento", weight="bold", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE), # type: ignore
-                    ft.Text("Servicio", weight="bold", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE), # type: ignore
+                    ft.Text("Documentos vencidos por período", weight="bold"),  # type: ignore
+                    *(trend or [ft.Text("Sin datos")]),
+                    ft.Divider(),
+                    ft.Text(f"Vencen en los próximos {self.HISTORY_EXPIRY_DAYS} días", weight="bold"),  # type: ignore
+                    *(upcoming or [ft.Text("Ninguno")]),
                 ],
-                spacing=10,
-                alignment=ft.MainAxisAlignment.CENTER,
+                scroll=ft.ScrollMode.AUTO,
+                width=720,
+                height=500,
             ),
-            padding=10,
-            bgcolor=ft.colors.GREY_900,
-            border=ft.border.all(1, ft.colors.GREY),
         )
-        rows = []
-        for record in scrape_data:
-            # Top-level fields.
-            documento = str(record.get("DocumentacionDenominacion", ""))
-            servicio = str(record.get("ServicioDenominacion", ""))
-            denominacion = str(record.get("DenominacionEnte", ""))
-            # Compute "Patente" if DenominacionEnte is one of the given values.
-            if denominacion.upper() in ["AUTOMOVIL", "CHASIS", "ACOPLADO"]:
-                patente_value = record.get("VehiculoPatente", "")
-            else:
-                patente_value = ""
-            # Nested fields from "Archivo".
-            archivo = record.get("Archivo", {})
-            estado_val = archivo.get("EstadoDenominacion", "")
-            
-            # Build cells for Denominación, Documento, Servicio.
-            denominacion_cell = ft.Text(denominacion, width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE)
-            patente_cell = ft.Text(patente_value, width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE)
-            documento_cell = ft.Text(documento, width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE)
-            servicio_cell = ft.Text(servicio, width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE)
-            
-            # Build the Estado cell based on its value.
-            if estado_val == "Pendiente":
-                estado_cell = ft.Container(
-                    content=ft.Text("Pendiente", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE),
-                    bgcolor=ft.colors.AMBER_700,
-                    width=200,
-                )
-            elif estado_val == "Aprobado":
-                fecha_str = archivo.get("FechaVencimiento", None)
-                if fecha_str:
-                    try:
-                        fecha_str = fecha_str.strip()
-                        if "T" in fecha_str:
-                            fecha_venc = datetime.datetime.strptime(fecha_str, "%Y-%m-%dT%H:%M:%S%z").date()
-                        else:
-                            fecha_venc = datetime.datetime.strptime(fecha_str, "%Y-%m-%d").date()
-                        days_left = (fecha_venc - datetime.date.today()).days
-                        estado_text = f"{days_left} días"
-                    except Exception:
-                        estado_text = "N/A"
-                else:
-                    estado_text = "N/A"
-                estado_cell = ft.Container(
-                    content=ft.Text(estado_text, width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE),
-                    bgcolor=ft.colors.GREEN_800,  # Dark green for "Aprobado"
-                    width=200,
-                )
-            elif estado_val == "Vencido":
-                estado_cell = ft.Container(
-                    content=ft.Text("Vencido", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE),
-                    bgcolor=ft.colors.ORANGE_800,  # Dark orange for "Vencido"
-                    width=200,
-                )
-            elif estado_val == "Pendiente aprobación":
-                estado_cell = ft.Container(
-                    content=ft.Text("Pendiente aprobación", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE),
-                    bgcolor=ft.colors.BLUE_800,  # Dark blue for "Pendiente aprobación"
-                    width=200,
-                )
-            else:
-                estado_cell = ft.Text("", width=200, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE)
-            
-            # Combine cells into a row with the following column order:
-            # Estado, Denominación, Patente, Documento, Servicio.
-            row = ft.Container(
-                content=ft.Row(
-                    controls=[
-                        estado_cell,
-                        denominacion_cell,
-                        patente_cell,
-                        documento_cell,
-                        servicio_cell,
-                    ],
-                    spacing=10,
-                    alignment=ft.MainAxisAlignment.CENTER,
-                ),
-                padding=8,
-                bgcolor=ft.colors.GREY_800,
-                border=ft.border.only(bottom=ft.BorderSide(1, ft.colors.GREY)),
-            )
-            rows.append(row)
-        return [header] + rows
+        self.page.open(dialog)
+
+    def _show_expired_accounts(self, emails):
+        """Saved accounts keep only their token; list those whose token expired,
+        each with a button to log in with it again."""
+        def relogin(email):
+            async def on_click(e):
+                self.page.close(dialog)
+                await self._switch_account(email)
+            return on_click
 
-    def _load_main_content(self, scrape_data=None):
+        dialog = ft.AlertDialog(
+            title=ft.Text("Sesiones expiradas"),
+            content=ft.Column(
+                controls=[
+                    ft.Text("Estas cuentas no se incluyeron; ingrese nuevamente con cada una:"),
+                    *(ft.Row([ft.Text(email, width=280), ft.TextButton("Ingresar", on_click=relogin(email))])
+                      for email in emails),
+                ],
+                tight=True,
+                width=420,
+            ),
+        )
+        self.page.open(dialog)
+
+    async def _switch_account(self, email: str = None): # type: ignore
+        self._stop_token_renewal()
+        # Keep the current account saved so "Todas las cuentas" still includes it,
+        # but only if the user asked to stay logged in.
+        if (self.state.credentials.get("keep_logged_in") and self.state.token_valid()
+                and self.state.credentials.get("email")):
+            self._account_store().save_state(self.state)
+        self.state = LoginState()
+        self.auth_manager = AuthManager(self.state)
+        await self._show_login_form(email)
+
+    async def _on_add_account(self, e):
+        await self._switch_account()
+
+    def _update_filter_options(self):
+        if self.estado_filter is None:
+            return
+        for dropdown, field in ((self.estado_filter, "estado"), (self.servicio_filter, "servicio")):
+            values = self.index.values(field)
+            dropdown.options = [ft.dropdown.Option(key="", text="Todos")] + [ft.dropdown.Option(v) for v in values]
+            if dropdown.value and dropdown.value not in values:
+                dropdown.value = ""
+
+    def _filtered_records(self):
+        if self.search_field is None:
+            return self.index.records
+        return self.index.query(
+            self.search_field.value or "",
+            estado=self.estado_filter.value, # type: ignore
+            servicio=self.servicio_filter.value, # type: ignore
+        )
+
+    async def _on_filter_change(self, e):
+        # Debounce: only the last change within FILTER_DEBOUNCE seconds updates the table.
+        if self._filter_task is not None:
+            self._filter_task.cancel()
+        self._filter_task = asyncio.create_task(self._apply_filters())
+
+    async def _apply_filters(self):
+        await asyncio.sleep(self.FILTER_DEBOUNCE)
+        if self.table is None:
+            return
+        self.table.set_records(self._filtered_records(), reset=True)
+        self.table.list_view.update()
+
+    def _prepare_records(self, scrape_data) -> tuple:
+        """Normalize, sort and index a payload. Runs in a worker thread; returns
+        (records, RecordIndex) for the event loop to swap in."""
+        # Parse the payload once; sorting and rendering use the precomputed fields.
+        with span("ui.normalize", records=len(scrape_data)):
+            records = normalize_records(scrape_data)
+        with span("ui.sort", records=len(records)):
+            records.sort(key=self.sort_key)
+        with span("ui.index", records=len(records)):
+            index = RecordIndex(records)
+        return records, index
+
+    async def _load_main_content(self, scrape_data=None):
         """Display a welcome message and, if scrape_data is provided, a custom-styled table that scrolls
         only within the table area. The table is sorted by Estado and its height is 80% of the window height."""
+        if scrape_data:
+            scrape_data, self.index = await asyncio.to_thread(self._prepare_records, scrape_data)
+        else:
+            scrape_data = None
+        if (scrape_data and self.table is not None and self.table.list_view.page is not None
+                and self.table.show_account == self.show_account):
+            # Table already on screen: patch only the rows that changed.
+            self._update_filter_options()
+            with span("ui.build_rows") as t:
+                t.update(self.table.set_records(self._filtered_records()))
+            with span("ui.page_update"):
+                self.page.update()
+            self._refresh_perf_overlay()
+            return scrape_data
         self.page.controls.clear() # type: ignore
         content_controls = [] # type: ignore
 
         if scrape_data:
             try:
                 TABLE_HEIGHT = 800 # type: ignore
-                # Sort and build table rows.
-                scrape_data.sort(key=self.sort_key) # type: ignore
-                table_rows = self._build_custom_table_rows(scrape_data)
-                # Create the scrollable table with initial height using self.page.window.height.
-                scrollable_table = ft.ListView(
-                    controls=table_rows,
-                    height = TABLE_HEIGHT,
-                    spacing=0
-                )
-                content_controls.append(scrollable_table) # type: ignore
+                # Show the first window of rows; they are rebound on scroll.
+                content_controls.append(self._build_filter_bar()) # type: ignore
+                with span("ui.build_rows") as t:
+                    self.table = DocumentTable(height=TABLE_HEIGHT, show_account=self.show_account)
+                    t.update(self.table.set_records(self._filtered_records()))
+                content_controls.append(self.table.list_view) # type: ignore
             except Exception as e:
                 show_error(self.page, str(e))
 
@@ -254,11 +531,17 @@ class MainFlow:
             # self.page.on_resized = on_resized
 
         self.page.controls.clear() # type: ignore
-        self.page.add(
-            ft.Column(
-                controls=content_controls,
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=20
+        with span("ui.page_update"):
+            self.page.add(
+                ft.Column(
+                    controls=content_controls,
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    spacing=20
+                )
             )
-        )
-        self.page.update()
\ No newline at end of file
+        self._refresh_perf_overlay()
+        return scrape_data
+
+    def _refresh_perf_overlay(self):
+        if self.perf_overlay is not None:
+            self.perf_overlay.refresh()
\ No newline at end of file
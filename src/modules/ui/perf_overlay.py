@@ -0,0 +1,32 @@
+import flet as ft
+
+from modules.core.timing import last_run
+
+
+class PerfOverlay:
+    """Debug panel pinned over the page with the span breakdown of the last run."""
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self.lines = ft.Column(spacing=2, scroll=ft.ScrollMode.AUTO, height=260)
+        self.panel = ft.Container(
+            content=self.lines,
+            width=360,
+            padding=8,
+            bgcolor="#cc000000",
+            border_radius=6,
+            right=10,
+            bottom=10,
+        )
+        self.page.overlay.append(self.panel)
+
+    def refresh(self):
+        name, spans = last_run()
+        total = sum(s["ms"] for s in spans if not s["span"].startswith("scrape."))
+        controls = [ft.Text(f"{name or '-'}  ({len(spans)} spans)", size=12, weight="bold", color=ft.colors.WHITE)]  # type: ignore
+        for s in spans:
+            extra = " ".join(f"{k}={s[k]}" for k in ("bytes", "records", "error") if s.get(k) is not None)
+            controls.append(ft.Text(f"{s['ms']:>9.1f} ms  {s['span']} {extra}", size=11, color=ft.colors.WHITE, font_family="monospace"))
+        controls.append(ft.Text(f"UI total: {total:.1f} ms", size=11, color=ft.colors.AMBER_200))
+        self.lines.controls = controls
+        self.page.update()
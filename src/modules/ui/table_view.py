@@ -0,0 +1,203 @@
+import flet as ft
+
+CELL_WIDTH = 200
+# Fixed heights, so rows outside the virtualized window can be replaced by spacers.
+ROW_HEIGHT = 40
+HEADER_HEIGHT = 44
+
+# Background color of the Estado cell for each value.
+ESTADO_COLORS = {
+    "Pendiente": ft.colors.AMBER_700,
+    "Aprobado": ft.colors.GREEN_800,               # Dark green for "Aprobado"
+    "Vencido": ft.colors.ORANGE_800,               # Dark orange for "Vencido"
+    "Pendiente aprobación": ft.colors.BLUE_800,    # Dark blue for "Pendiente aprobación"
+}
+
+
+def _cell(value: str = "", **kwargs) -> ft.Text:
+    return ft.Text(value, width=CELL_WIDTH, text_align=ft.TextAlign.CENTER, color=ft.colors.WHITE,
+                   max_lines=1, overflow=ft.TextOverflow.ELLIPSIS, **kwargs)
+
+
+def build_header(show_account: bool = False) -> ft.Container:
+    # Header row with five columns:
+    # 1) Estado, 2) Denominación, 3) Patente, 4) Documento, 5) Servicio,
+    # preceded by Cuenta when several accounts share the table.
+    titles = ("Estado", "Denominación", "Patente", "Documento", "Servicio")
+    if show_account:
+        titles = ("Cuenta",) + titles
+    return ft.Container(
+        content=ft.Row(
+            controls=[
+                _cell(title, weight="bold")  # type: ignore
+                for title in titles
+            ],
+            spacing=10,
+            alignment=ft.MainAxisAlignment.CENTER,
+        ),
+        padding=10,
+        height=HEADER_HEIGHT,
+        bgcolor=ft.colors.GREY_900,
+        border=ft.border.all(1, ft.colors.GREY),
+    )
+
+
+def row_values(record) -> tuple:
+    """Cell texts of a DocumentRecord: (estado, denominacion, patente, documento, servicio)."""
+    if record.estado == "Aprobado":
+        estado_text = f"{record.days_left} días" if record.days_left is not None else "N/A"
+    elif record.estado in ESTADO_COLORS:
+        estado_text = record.estado
+    else:
+        estado_text = ""
+    return estado_text, record.denominacion, record.patente, record.documento, record.servicio
+
+
+def diff_records(old_keys, new_records) -> tuple:
+    """Compare a set of keys with new records: (added, removed) key sets."""
+    new_keys = {r.key for r in new_records}
+    old_keys = set(old_keys)
+    return new_keys - old_keys, old_keys - new_keys
+
+
+class TableRow:
+    """Controls of one table row. Built once and rebound to other records when recycled."""
+
+    def __init__(self, record=None, show_account: bool = False):
+        self.key = None
+        self.values = None
+        self.account = _cell() if show_account else None
+        self.estado_text = _cell()
+        self.estado = ft.Container(content=self.estado_text, width=CELL_WIDTH)
+        self.cells = [_cell() for _ in range(4)]
+        # Column order: [Cuenta,] Estado, Denominación, Patente, Documento, Servicio.
+        leading = [self.account] if self.account is not None else []
+        self.control = ft.Container(
+            content=ft.Row(
+                controls=[*leading, self.estado, *self.cells],
+                spacing=10,
+                alignment=ft.MainAxisAlignment.CENTER,
+            ),
+            padding=8,
+            height=ROW_HEIGHT,
+            bgcolor=ft.colors.GREY_800,
+            border=ft.border.only(bottom=ft.BorderSide(1, ft.colors.GREY)),
+        )
+        if record is not None:
+            self.bind(record)
+
+    def bind(self, record) -> bool:
+        """Show `record` in this row. Returns False when nothing visible changed."""
+        self.key = record.key
+        values = row_values(record) + (record.estado, record.account)
+        if values == self.values:
+            return False
+        self.values = values
+        estado_text, *cells, estado, account = values
+        if self.account is not None:
+            self.account.value = account
+        self.estado_text.value = estado_text
+        self.estado.bgcolor = ESTADO_COLORS.get(estado)
+        for cell, value in zip(self.cells, cells):
+            cell.value = value
+        return True
+
+
+class DocumentTable:
+    """Scrollable document table.
+
+    In virtualized mode a fixed window of `page_size + buffer` rows is built and
+    rebound to `records[offset:offset + window]` as the user scrolls; spacers
+    above and below the window keep the scroll extent of the full list. Rows
+    have a fixed height, so the client holds the same number of controls
+    whatever the record count. Row controls are rebound when the records change
+    instead of being rebuilt.
+    """
+
+    def __init__(self, height: int = 800, page_size: int = 100, buffer: int = 50, virtualized: bool = True,
+                 show_account: bool = False):
+        self.show_account = show_account
+        self.height = height
+        self.page_size = page_size
+        self.buffer = buffer
+        self.virtualized = virtualized
+        self.records = []
+        self.offset = 0  # position of the first record bound to a row
+        self._rows = []
+        self._pool = []
+        self.header = build_header(show_account)
+        self._leading = ft.Container(height=0)
+        self._trailing = ft.Container(height=0)
+        self.list_view = ft.ListView(
+            controls=[self.header],
+            height=height,
+            spacing=0,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=100,
+        )
+
+    @property
+    def window(self) -> int:
+        return self.page_size + self.buffer if self.virtualized else len(self.records)
+
+    def set_records(self, records, reset: bool = False) -> dict:
+        """Show `records` (already sorted), patching the current rows in place.
+
+        Rows are matched by DocumentRecord.key: a record still in the window keeps
+        its row control and only changed cells are rewritten; the others rebind
+        the rows that were freed. Call list_view.update() afterwards and Flet
+        sends only the changed cells and the reordered children.
+        The window stays at the same offset; with `reset` (e.g. a new filter) it
+        goes back to the first record and the list scrolls to the top.
+        """
+        added, removed = diff_records((r.key for r in self.records), records)
+        self.records = list(records)
+        changed = self._bind_window(0 if reset else self.offset)
+        if reset and self.list_view.page is not None:
+            self.list_view.scroll_to(offset=0)
+        return {"added": len(added), "removed": len(removed), "changed": changed}
+
+    def extend_records(self, records):
+        """Append records at the end (e.g. while a response is streaming in); rows
+        are only built while the window is not full yet."""
+        self.records.extend(records)
+        self._bind_window(self.offset)
+
+    def _bind_window(self, offset: int) -> int:
+        """Bind the rows to the records of the window starting at `offset`.
+        Returns the number of rows whose cells changed."""
+        self.offset = max(0, min(offset, len(self.records) - self.window))
+        visible = self.records[self.offset:self.offset + self.window]
+        keys = {record.key for record in visible}
+        by_key = {row.key: row for row in self._rows if row.key in keys}
+        spare = [row for row in self._rows if row.key not in keys] + self._pool
+        rows = []
+        changed = 0
+        for record in visible:
+            row = by_key.pop(record.key, None)
+            if row is None:
+                row = spare.pop() if spare else TableRow(show_account=self.show_account)
+            if row.bind(record):
+                changed += 1
+            rows.append(row)
+        self._rows = rows
+        self._pool = spare
+        self._leading.height = self.offset * ROW_HEIGHT
+        self._trailing.height = (len(self.records) - self.offset - len(rows)) * ROW_HEIGHT
+        self.list_view.controls = [self.header, self._leading, *(row.control for row in rows), self._trailing]
+        return changed
+
+    async def _on_scroll(self, e: ft.OnScrollEvent):
+        # Async so Flet runs it on the event loop, like set_records, not in a worker thread.
+        if not self.virtualized or e.pixels is None:
+            return
+        first = max(0, int((e.pixels - HEADER_HEIGHT) // ROW_HEIGHT))
+        visible = int(self.height // ROW_HEIGHT) + 1
+        margin = self.buffer // 2
+        low = max(0, first - margin)
+        high = min(len(self.records), first + visible + margin)
+        if self.offset <= low and high <= self.offset + len(self._rows):
+            return
+        # Center the window on what is on screen.
+        self._bind_window(first - (self.window - visible) // 2)
+        self.list_view.update()
@@ -12,6 +12,16 @@ def show_error(page: ft.Page, message: str):
     page.overlay.append(page.snack_bar) # type: ignore
     page.update()
 
+def show_notification(page: ft.Page, message: str, duration: int = 8000):
+    page.snack_bar = ft.SnackBar( # type: ignore
+        content=ft.Text(message, color="#fefefe"),
+        bgcolor="#1b5e20",
+        duration=duration,
+    )
+    page.snack_bar.open = True # type: ignore
+    page.overlay.append(page.snack_bar) # type: ignore
+    page.update()
+
 def loading_indicator(page: ft.Page, text: str = "Cargando..."):
     # page.controls.clear() # type: ignore
     page.add(
@@ -0,0 +1,58 @@
+import datetime
+
+from modules.data.expiry import ExpiryEngine
+from modules.data.records import DocumentRecord
+
+TODAY = datetime.date(2025, 3, 1)
+
+
+def make_record(archivo_id, expires):
+    return DocumentRecord({
+        "EntidadId": 1,
+        "PeriodoMes": 3,
+        "PeriodoAnio": 2025,
+        "DocumentacionDenominacion": "Seguro",
+        "Archivo": {
+            "Id": archivo_id,
+            "EstadoDenominacion": "Aprobado",
+            "FechaVencimiento": expires.isoformat(),
+        },
+    }, today=TODAY)
+
+
+def keys(records):
+    return [r.key for r in records]
+
+
+def test_removed_and_readded_record_is_listed_once():
+    a = make_record(1, TODAY + datetime.timedelta(days=10))
+    b = make_record(2, TODAY + datetime.timedelta(days=20))
+    engine = ExpiryEngine()
+    engine.update([a, b], TODAY)
+    engine.update([b], TODAY)
+    engine.update([a, b], TODAY)
+
+    assert keys(engine.next_to_expire(5)) == [a.key, b.key]
+
+
+def test_expiry_changed_back_is_listed_once():
+    first = make_record(1, TODAY + datetime.timedelta(days=10))
+    moved = make_record(1, TODAY + datetime.timedelta(days=40))
+    engine = ExpiryEngine()
+    engine.update([first], TODAY)
+    engine.update([moved], TODAY)
+    engine.update([first], TODAY)
+
+    assert keys(engine.next_to_expire(5)) == [first.key]
+    assert keys(engine.expiring_within(60, TODAY)) == [first.key]
+
+
+def test_readded_record_alerts_once():
+    a = make_record(1, TODAY + datetime.timedelta(days=5))
+    engine = ExpiryEngine(thresholds=(7,))
+    engine.update([a], TODAY)
+    engine.update([], TODAY)
+    engine.update([a], TODAY)
+
+    assert [(r.key, t) for r, t in engine.due_alerts(TODAY)] == [(a.key, 7)]
+    assert engine.due_alerts(TODAY) == []
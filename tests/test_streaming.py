@@ -0,0 +1,52 @@
+import json
+import random
+
+import pytest
+
+from modules.core.exceptions import DataError
+from modules.scrape.streaming import iter_json_array
+
+BODY = json.dumps([
+    {"Id": 1, "DocumentacionDenominacion": "Póliza de seguro", "Archivo": {"EstadoDenominacion": "Pendiente aprobación"}},
+    {"Id": 2, "DenominacionEnte": "AUTOMÓVIL ñandú €", "VehiculoPatente": "AB123CD"},
+    "texto con ünïcode",
+    12345,
+    -1.5e3,
+    True,
+    None,
+    [1, [2, {"a": "b"}]],
+    {},
+], ensure_ascii=False).encode("utf-8")
+
+
+def random_chunks(body: bytes, rng: random.Random) -> list:
+    cuts = sorted(rng.sample(range(1, len(body)), rng.randint(1, min(40, len(body) - 1))))
+    return [body[start:end] for start, end in zip([0] + cuts, cuts + [len(body)])]
+
+
+def test_any_chunk_boundaries_decode_the_same():
+    expected = json.loads(BODY)
+    rng = random.Random(0)
+    for _ in range(500):
+        assert list(iter_json_array(random_chunks(BODY, rng))) == expected
+
+
+def test_single_byte_chunks():
+    assert list(iter_json_array([BODY[i:i + 1] for i in range(len(BODY))])) == json.loads(BODY)
+
+
+@pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[1]", b'[ {"a": 1} , 2 ]'])
+def test_valid_arrays(body):
+    assert list(iter_json_array([body])) == json.loads(body)
+
+
+@pytest.mark.parametrize("body", [
+    b"[1 2]", b"[1,,2]", b"[,1]", b"[1,]", b"[,]", b'[{"a": 1} {"b": 2}]',
+    b"[1, 2", b"[", b"", b'{"a": 1}', b"[1, tru]", b"[1, }]",
+])
+def test_malformed_arrays_raise(body):
+    rng = random.Random(1)
+    splits = [[body]] + ([random_chunks(body, rng) for _ in range(20)] if len(body) > 1 else [])
+    for chunks in splits:
+        with pytest.raises(DataError):
+            list(iter_json_array(chunks))